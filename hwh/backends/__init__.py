@@ -5,27 +5,33 @@ Backend implementations for hardware devices.
 from .base import (
     Backend,
     BusBackend,
+    BusProtocol,
     DebugBackend,
     GlitchBackend,
     get_backend,
+    list_backends,
     register_backend,
     SPIConfig,
     I2CConfig,
     UARTConfig,
     GlitchConfig,
+    GlitchSweepResults,
     TriggerEdge,
 )
 
 __all__ = [
     "Backend",
     "BusBackend",
+    "BusProtocol",
     "DebugBackend",
     "GlitchBackend",
     "get_backend",
+    "list_backends",
     "register_backend",
     "SPIConfig",
     "I2CConfig",
     "UARTConfig",
     "GlitchConfig",
+    "GlitchSweepResults",
     "TriggerEdge",
 ]
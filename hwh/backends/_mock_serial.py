@@ -0,0 +1,145 @@
+"""
+Record/replay serial transports for hardware-free testing.
+
+RecordingSerial wraps a live serial.Serial and logs every write/read;
+ReplaySerial plays a recording back without opening a port, asserting
+that writes match what the real device saw. Recordings are JSON with
+hex payloads so they diff cleanly and need no extra dependency.
+
+Typical flow:
+    HWH_RECORD=buspirate.json   record traffic against real hardware
+    HWH_REPLAY=buspirate.json   replay it in CI without hardware
+"""
+
+import json
+import os
+
+
+class RecordingSerial:
+    """Proxy around serial.Serial that logs traffic for later replay."""
+
+    def __init__(self, port, baudrate, timeout=1, path="serial_recording.json"):
+        import serial
+        self._ser = serial.Serial(port, baudrate, timeout=timeout)
+        self._path = path
+        self._log = []
+        self.port = port
+        self.baudrate = baudrate
+
+    @property
+    def is_open(self):
+        return self._ser.is_open
+
+    @property
+    def in_waiting(self):
+        return self._ser.in_waiting
+
+    @property
+    def timeout(self):
+        return self._ser.timeout
+
+    @timeout.setter
+    def timeout(self, value):
+        self._ser.timeout = value
+
+    def write(self, data):
+        self._log.append({"op": "write", "data": bytes(data).hex()})
+        return self._ser.write(data)
+
+    def read(self, size=1):
+        data = self._ser.read(size)
+        self._log.append({"op": "read", "n": size, "data": bytes(data).hex()})
+        return data
+
+    def read_until(self, expected=b'\n', size=None):
+        data = self._ser.read_until(expected, size)
+        self._log.append({"op": "read_until", "data": bytes(data).hex()})
+        return data
+
+    def flush(self):
+        self._ser.flush()
+
+    def reset_input_buffer(self):
+        self._ser.reset_input_buffer()
+
+    def reset_output_buffer(self):
+        self._ser.reset_output_buffer()
+
+    def close(self):
+        with open(self._path, "w") as f:
+            json.dump(self._log, f, indent=1)
+        self._ser.close()
+
+
+class ReplaySerial:
+    """Replays a RecordingSerial log; raises on writes that diverge."""
+
+    def __init__(self, path):
+        with open(path) as f:
+            self._log = json.load(f)
+        self._pos = 0
+        self.is_open = True
+        self.timeout = 0
+        self.port = path  # stands in for the device path in log output
+
+    def _next(self, op):
+        if self._pos >= len(self._log):
+            raise AssertionError(f"Replay log exhausted before {op}")
+        entry = self._log[self._pos]
+        if entry["op"] != op:
+            raise AssertionError(
+                f"Replay expected {entry['op']} at entry {self._pos}, got {op}")
+        self._pos += 1
+        return entry
+
+    @property
+    def in_waiting(self):
+        if self._pos < len(self._log) and self._log[self._pos]["op"] == "read":
+            return len(bytes.fromhex(self._log[self._pos]["data"]))
+        return 0
+
+    def write(self, data):
+        entry = self._next("write")
+        expected = bytes.fromhex(entry["data"])
+        if bytes(data) != expected:
+            raise AssertionError(
+                f"Replay write mismatch at entry {self._pos - 1}: "
+                f"expected {expected.hex()}, got {bytes(data).hex()}")
+        return len(data)
+
+    def read(self, size=1):
+        return bytes.fromhex(self._next("read")["data"])
+
+    def read_until(self, expected=b'\n', size=None):
+        return bytes.fromhex(self._next("read_until")["data"])
+
+    def flush(self):
+        pass
+
+    def reset_input_buffer(self):
+        pass
+
+    def reset_output_buffer(self):
+        pass
+
+    def close(self):
+        self.is_open = False
+
+
+def open_transport(port, baudrate, timeout=1):
+    """Return a real, recording, or replaying serial transport.
+
+    Selection is driven by the HWH_REPLAY / HWH_RECORD environment
+    variables, each holding a recording path; unset means a plain
+    serial.Serial as usual.
+    """
+    replay = os.environ.get("HWH_REPLAY")
+    if replay:
+        return ReplaySerial(replay)
+
+    record = os.environ.get("HWH_RECORD")
+    if record:
+        return RecordingSerial(port, baudrate, timeout=timeout, path=record)
+
+    import serial
+    return serial.Serial(port, baudrate, timeout=timeout)
@@ -12,8 +12,8 @@ from typing import Any, Optional
 import time
 
 from .base import (
-    GlitchBackend, register_backend,
-    GlitchConfig, TriggerEdge
+    GlitchBackend, GlitchSweepResults, register_backend,
+    GlitchConfig, TriggerEdge, _expand_sweep_grid
 )
 from ..detect import DeviceInfo
 
@@ -208,55 +208,52 @@ class BoltBackend(GlitchBackend):
     def run_glitch_sweep(self,
                          width_range: tuple[int, int],  # (min_ns, max_ns)
                          width_step: int,               # Step in ns
-                         offset_range: tuple[int, int], # (min_ns, max_ns)  
+                         offset_range: tuple[int, int], # (min_ns, max_ns)
                          offset_step: int,              # Step in ns
                          attempts_per_setting: int = 10,
-                         callback=None) -> list[dict]:
+                         callback=None) -> GlitchSweepResults:
         """
         Run a parameter sweep for glitch attacks.
-        
+
+        Overrides the base sweep to carry the configured trigger
+        channel/edge into each point and to pace glitches 1ms apart.
+
         Args:
             width_range: (min, max) glitch width in nanoseconds
             offset_range: (min, max) offset after trigger in nanoseconds
             attempts_per_setting: Number of glitches at each parameter combo
-            callback: Optional function called after each glitch with (config, attempt, result)
-            
+            callback: Optional function called after each glitch with (config, attempt)
+
         Returns:
-            List of dicts with parameters and any captured results
+            GlitchSweepResults holding the sweep as parallel columns;
+            indexing it yields per-point result dictionaries
         """
-        results = []
-        
-        for width in range(width_range[0], width_range[1] + 1, width_step):
-            for offset in range(offset_range[0], offset_range[1] + 1, offset_step):
+        width_col, offset_col, attempt_col, status = _expand_sweep_grid(
+            width_range, width_step, offset_range, offset_step,
+            attempts_per_setting)
+        callback_results = [] if callback else None
+
+        config = None
+        for index in range(len(width_col)):
+            if config is None or attempt_col[index] == 0:
                 config = GlitchConfig(
-                    width_ns=width,
-                    offset_ns=offset,
+                    width_ns=int(width_col[index]),
+                    offset_ns=int(offset_col[index]),
                     trigger_channel=self._glitch_config.trigger_channel,
                     trigger_edge=self._glitch_config.trigger_edge
                 )
-                
                 self.configure_glitch(config)
-                
-                for attempt in range(attempts_per_setting):
-                    self.trigger()
-                    
-                    result = {
-                        "width_ns": width,
-                        "offset_ns": offset,
-                        "attempt": attempt,
-                        "timestamp": time.time(),
-                    }
-                    
-                    if callback:
-                        callback_result = callback(config, attempt)
-                        result["callback_result"] = callback_result
-                    
-                    results.append(result)
-                    
-                    # Small delay between glitches
-                    time.sleep(0.001)
-        
-        return results
+
+            status[index] = 1 if self.trigger() else 0
+
+            if callback:
+                callback_results.append(callback(config, int(attempt_col[index])))
+
+            # Small delay between glitches
+            time.sleep(0.001)
+
+        return GlitchSweepResults(width_col, offset_col, attempt_col,
+                                  status, callback_results)
     
     # --------------------------------------------------------------------------
     # Logic Analyzer (via SUMP protocol)
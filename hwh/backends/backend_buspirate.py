@@ -7,6 +7,8 @@ Supports: SPI, I2C, UART, 1-Wire, PSU control
 Reference: https://docs.buspirate.com/docs/binmode-reference/protocol-bpio2/
 """
 
+import logging
+import struct
 from typing import Any, Optional
 
 from .base import (
@@ -15,11 +17,28 @@ from .base import (
 )
 from ..detect import DeviceInfo
 
-# Import official BPIO2 library
-from ..pybpio.bpio_client import BPIOClient
-from ..pybpio.bpio_spi import BPIOSPI
-from ..pybpio.bpio_i2c import BPIOI2C
-from ..pybpio.bpio_uart import BPIOUART
+# The official BPIO2 library (and the pyserial/flatbuffers/cobs stack it
+# drags in) is imported inside the methods that first need it, so merely
+# registering this backend costs nothing for tools that never touch a
+# Bus Pirate
+
+# Module logger; disabled levels short-circuit before any formatting, unlike
+# the print calls this file used to make on every connect/configure step
+log = logging.getLogger(__name__)
+
+# Precomputed I2C address bytes; a one-byte slice of these avoids building a
+# fresh bytes object per transfer on hot scan/dump paths
+_I2C_WRITE_ADDR = bytes((a << 1) & 0xFE for a in range(128))
+_I2C_READ_ADDR = bytes(((a << 1) | 1) & 0xFF for a in range(128))
+
+# Precompiled 0x03 read command + 24-bit address encoder; skips struct's
+# per-call format-string cache lookup on multi-thousand-page dumps
+_FLASH_READ_CMD = struct.Struct('>I')
+
+
+def _flash_read_cmd(address: int) -> bytes:
+    """Standard SPI flash read command: 0x03 + 24-bit address."""
+    return _FLASH_READ_CMD.pack((0x03 << 24) | (address & 0xFFFFFF))
 
 
 class BusPirateBackend(BusBackend):
@@ -33,6 +52,9 @@ class BusPirateBackend(BusBackend):
     We use the BPIO2 interface for programmatic control.
     """
 
+    # Connection-state cache shared across script invocations
+    STATE_CACHE = "~/.cache/hwh/buspirate.json"
+
     def __init__(self, device: DeviceInfo):
         super().__init__(device)
         self._client = None
@@ -40,6 +62,71 @@ class BusPirateBackend(BusBackend):
         self._i2c = None
         self._uart = None
         self._current_mode = None
+        self._mode_config = None
+        self._status_cached = None
+
+    def _state_cache_path(self):
+        import os
+        return os.path.expanduser(self.STATE_CACHE)
+
+    def save_state(self):
+        """Persist the connected state so the next script run can skip
+        redundant mode configuration."""
+        import json
+        import os
+
+        path = self._state_cache_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump({
+                    'port': self.device.port,
+                    'mode': self._current_mode,
+                    'mode_config': self._mode_config,
+                }, f)
+        except OSError:
+            pass
+
+    def _cached_config_matches(self, mode: str, mode_config: dict) -> bool:
+        """True when the cached state covers this port/mode/config."""
+        cached = self.load_state()
+        return (cached is not None
+                and cached.get('port') == self.device.port
+                and cached.get('mode') == mode
+                and cached.get('mode_config') == mode_config)
+
+    def load_state(self) -> Optional[dict]:
+        """Load the cached connection state, or None if absent/unreadable."""
+        import json
+
+        try:
+            with open(self._state_cache_path()) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _await_console(console, tokens: tuple[bytes, ...], timeout: float) -> bytes:
+        """Read from the console until one of the tokens appears or timeout.
+
+        Returns whatever was read either way, so callers can still log the
+        response; correctness does not depend on matching, only latency does.
+        """
+        import time
+
+        if console.timeout != 0.05:
+            console.timeout = 0.05
+        deadline = time.monotonic() + timeout
+        buf = bytearray()
+        while time.monotonic() < deadline:
+            chunk = console.read(console.in_waiting or 1)
+            if chunk:
+                buf += chunk
+                if any(token in buf for token in tokens):
+                    break
+            else:
+                time.sleep(0.01)
+        return bytes(buf)
 
     def _enter_binary_mode(self, console_port: str) -> bool:
         """
@@ -52,53 +139,59 @@ class BusPirateBackend(BusBackend):
             True if binary mode was entered successfully
         """
         import serial
-        import time
+
+        from ..pybpio.bpio_client import request_low_latency
 
         try:
-            print(f"[BusPirate] Entering binary mode via console: {console_port}")
+            log.info("Entering binary mode via console: %s", console_port)
 
             # Open console port at 115200 baud
             console = serial.Serial(console_port, 115200, timeout=2)
-            time.sleep(0.1)
+            request_low_latency(console)
 
             # Clear any existing data
             console.reset_input_buffer()
             console.reset_output_buffer()
 
-            # Send binmode command
+            # Send binmode command and poll for the mode menu instead of
+            # sleeping a fixed half second
             console.write(b'binmode\r\n')
-            time.sleep(0.5)
-
-            # Read response (should show menu)
-            response = b''
-            if console.in_waiting > 0:
-                response = console.read(console.in_waiting)
-                print(f"[BusPirate] Menu response: {response.decode('utf-8', errors='ignore')[:200]}")
+            response = self._await_console(console, (b'mode', b'BBIO'), 1.0)
+            if response:
+                log.debug("Menu response: %s", response.decode('utf-8', errors='ignore')[:200])
 
             # Select BBIO2 (option 2)
-            print(f"[BusPirate] Selecting BBIO2 binary mode...")
+            log.info("Selecting BBIO2 binary mode...")
             console.write(b'2\r\n')
-            time.sleep(0.5)
-
-            # Read confirmation
-            if console.in_waiting > 0:
-                response = console.read(console.in_waiting)
-                print(f"[BusPirate] Mode change response: {response.decode('utf-8', errors='ignore')[:200]}")
+            response = self._await_console(console, (b'binmode', b'BBIO2'), 1.0)
+            if response:
+                log.debug("Mode change response: %s", response.decode('utf-8', errors='ignore')[:200])
 
             console.close()
-            print(f"[BusPirate] Binary mode command sent, waiting for mode switch...")
-            time.sleep(1)  # Give it time to switch modes
+            log.info("Binary mode command sent")
 
             return True
 
         except Exception as e:
-            print(f"[BusPirate] Failed to enter binary mode: {e}")
+            log.warning("Failed to enter binary mode: %s", e)
             return False
 
+    def _log_status(self, status: dict) -> str:
+        """Print the connect-time status summary and return the current mode."""
+        mode = status.get('mode_current', 'unknown')
+        fw_ver = f"{status['version_firmware_major']}.{status['version_firmware_minor']}"
+        hw_ver = f"{status['version_hardware_major']} REV{status['version_hardware_minor']}"
+        log.info("Firmware: v%s", fw_ver)
+        log.info("Hardware: v%s", hw_ver)
+        log.info("Current mode: %s", mode)
+        return mode
+
     def connect(self) -> bool:
         """Connect to Bus Pirate BPIO2 interface."""
+        from ..pybpio.bpio_client import BPIOClient
+
         if not self.device.port:
-            print(f"[BusPirate] No port specified for {self.device.name}")
+            log.info("No port specified for %s", self.device.name)
             return False
 
         try:
@@ -114,7 +207,7 @@ class BusPirateBackend(BusBackend):
                 bpio2_port = bpio2_port.replace('buspirate1', 'buspirate3')
 
             # Try 1: Attempt to connect to BPIO2 port (might already be in binary mode)
-            print(f"[BusPirate] Attempting direct connection to BPIO2 port: {bpio2_port}")
+            log.info("Attempting direct connection to BPIO2 port: %s", bpio2_port)
             try:
                 self._client = BPIOClient(
                     port=bpio2_port,
@@ -126,62 +219,67 @@ class BusPirateBackend(BusBackend):
                 if status:
                     # Success! Already in binary mode
                     self._connected = True
-                    mode = status.get('mode_current', 'unknown')
-                    fw_ver = f"{status['version_firmware_major']}.{status['version_firmware_minor']}"
-                    hw_ver = f"{status['version_hardware_major']} REV{status['version_hardware_minor']}"
-                    print(f"[BusPirate] Connected successfully (already in binary mode)!")
-                    print(f"[BusPirate] Firmware: v{fw_ver}")
-                    print(f"[BusPirate] Hardware: v{hw_ver}")
-                    print(f"[BusPirate] Current mode: {mode}")
-                    self._current_mode = mode
+                    log.info("Connected successfully (already in binary mode)!")
+                    self._current_mode = self._log_status(status)
+                    self._status_cached = status
+                    self.save_state()
                     return True
                 else:
                     # No response, need to enter binary mode
-                    print(f"[BusPirate] Not in binary mode, will attempt to enter it...")
+                    log.info("Not in binary mode, will attempt to enter it...")
                     self._client.close()
                     self._client = None
             except Exception as e:
-                print(f"[BusPirate] Direct connection failed (expected): {e}")
+                log.warning("Direct connection failed (expected): %s", e)
                 if self._client:
                     self._client.close()
                     self._client = None
 
             # Try 2: Enter binary mode via console
             if not self._enter_binary_mode(console_port):
-                print(f"[BusPirate] Failed to enter binary mode")
+                log.warning("Failed to enter binary mode")
                 return False
 
-            # Try 3: Connect to BPIO2 port after entering binary mode
-            print(f"[BusPirate] Connecting to BPIO2 port after mode switch...")
-            self._client = BPIOClient(
-                port=bpio2_port,
-                baudrate=3000000,
-                timeout=2,
-                debug=False
-            )
+            # Try 3: Connect to BPIO2 port after entering binary mode.
+            # Poll until the device answers a status request instead of
+            # sleeping a fixed second for the mode switch.
+            log.info("Connecting to BPIO2 port after mode switch...")
+            import time
+            status = None
+            deadline = time.monotonic() + 1.0
+            while True:
+                try:
+                    self._client = BPIOClient(
+                        port=bpio2_port,
+                        baudrate=3000000,
+                        timeout=2,
+                        debug=False
+                    )
+                    status = self._client.status_request()
+                except Exception:
+                    status = None
+                if status or time.monotonic() >= deadline:
+                    break
+                if self._client:
+                    self._client.close()
+                    self._client = None
+                time.sleep(0.05)
 
-            self._connected = True
+            self._connected = self._client is not None
 
-            # Verify connection
-            print(f"[BusPirate] Requesting status...")
-            status = self._client.status_request()
             if status:
-                mode = status.get('mode_current', 'unknown')
-                fw_ver = f"{status['version_firmware_major']}.{status['version_firmware_minor']}"
-                hw_ver = f"{status['version_hardware_major']} REV{status['version_hardware_minor']}"
-                print(f"[BusPirate] Connected successfully!")
-                print(f"[BusPirate] Firmware: v{fw_ver}")
-                print(f"[BusPirate] Hardware: v{hw_ver}")
-                print(f"[BusPirate] Current mode: {mode}")
-                self._current_mode = mode
+                log.info("Connected successfully!")
+                self._current_mode = self._log_status(status)
+                self._status_cached = status
+                self.save_state()
                 return True
             else:
-                print(f"[BusPirate] No response from status request after entering binary mode")
+                log.warning("No response from status request after entering binary mode")
                 self.disconnect()
                 return False
 
         except Exception as e:
-            print(f"[BusPirate] Connection failed: {e}")
+            log.warning("Connection failed: %s", e)
             import traceback
             traceback.print_exc()
             return False
@@ -197,14 +295,37 @@ class BusPirateBackend(BusBackend):
         self._spi = None
         self._i2c = None
         self._connected = False
+        self._status_cached = None
+
+    # Status fields that change at runtime; everything else (versions, modes,
+    # limits) is fixed after connect and served from the cached status dict
+    _LIVE_STATUS_KEYS = (
+        'psu_enabled', 'psu_set_mv', 'psu_set_ma',
+        'psu_measured_mv', 'psu_measured_ma', 'psu_current_error',
+        'adc_mv',
+    )
 
     def get_info(self) -> dict[str, Any]:
         """Get Bus Pirate status information."""
         if not self._connected or not self._client:
             return {"error": "Not connected"}
 
-        status = self._client.status_request()
-        return status if status else {"error": "Status request failed"}
+        if self._status_cached is None:
+            status = self._client.status_request()
+            if status:
+                self._status_cached = status
+            return status if status else {"error": "Status request failed"}
+
+        # Re-query only the live PSU/ADC fields and merge them over the
+        # cached full status instead of round-tripping everything again
+        from ..tooling.bpio.StatusRequestTypes import StatusRequestTypes
+
+        info = dict(self._status_cached)
+        live = self._client.status_request(query=(StatusRequestTypes.PSU, StatusRequestTypes.ADC))
+        if live:
+            for key in self._LIVE_STATUS_KEYS:
+                info[key] = live[key]
+        return info
 
     # --------------------------------------------------------------------------
     # SPI Interface
@@ -217,12 +338,29 @@ class BusPirateBackend(BusBackend):
 
         # Create SPI interface if needed
         if not self._spi:
+            from ..pybpio.bpio_spi import BPIOSPI
             self._spi = BPIOSPI(self._client)
 
         # Map config to BPIO2 parameters
         clock_polarity = bool((config.mode >> 1) & 1)  # CPOL
         clock_phase = bool(config.mode & 1)            # CPHA
 
+        mode_config = {
+            'speed': config.speed_hz,
+            'clock_polarity': clock_polarity,
+            'clock_phase': clock_phase,
+            'chip_select_idle': config.cs_active_low,
+        }
+
+        # Skip reconfiguration when the live mode (verified by the status
+        # request at connect) matches the cached configuration from a
+        # previous run
+        if self._current_mode == "SPI" and self._cached_config_matches("SPI", mode_config):
+            self._spi.configured = True
+            self._mode_config = mode_config
+            log.info("SPI already configured (cached): %sHz, mode=%s", config.speed_hz, config.mode)
+            return True
+
         # Configure SPI mode with all parameters
         success = self._spi.configure(
             speed=config.speed_hz,
@@ -233,7 +371,9 @@ class BusPirateBackend(BusBackend):
 
         if success:
             self._current_mode = "SPI"
-            print(f"[BusPirate] SPI configured: {config.speed_hz}Hz, mode={config.mode}")
+            self._mode_config = mode_config
+            self.save_state()
+            log.info("SPI configured: %sHz, mode=%s", config.speed_hz, config.mode)
 
         return success
 
@@ -251,19 +391,78 @@ class BusPirateBackend(BusBackend):
             return b''
         return self.spi_transfer(b'\x9f', read_len=3)
 
+    # Window size and pipeline depth for chunked flash reads
+    FLASH_READ_CHUNK = 4096
+    FLASH_READ_INFLIGHT = 8
+
     def spi_flash_read(self, address: int, length: int) -> bytes:
         """Read from SPI flash memory."""
         if not self._connected or not self._spi:
             return b''
 
         # Standard SPI flash read command: 0x03 + 24-bit address
-        cmd = bytes([
-            0x03,
-            (address >> 16) & 0xFF,
-            (address >> 8) & 0xFF,
-            address & 0xFF
-        ])
-        return self.spi_transfer(cmd, read_len=length)
+        if length <= self.FLASH_READ_CHUNK:
+            cmd = _flash_read_cmd(address)
+            return self.spi_transfer(cmd, read_len=length)
+
+        # Large reads: split into fixed windows and pipeline them so USB
+        # turnaround overlaps with flash clocking
+        offsets = range(0, length, self.FLASH_READ_CHUNK)
+        requests = [
+            {
+                'start_main': True,
+                'data_write': _flash_read_cmd(address + off),
+                'bytes_read': min(self.FLASH_READ_CHUNK, length - off),
+                'stop_main': True,
+            }
+            for off in offsets
+        ]
+
+        results = self._client.data_request_batch(requests, window=self.FLASH_READ_INFLIGHT)
+
+        # Stitch chunks into a preallocated buffer
+        out = bytearray(length)
+        for off, chunk in zip(offsets, results):
+            if not chunk:
+                return b''
+            out[off:off + len(chunk)] = chunk
+
+        return bytes(out)
+
+    def spi_flash_read_batch(self, addrs: list[int], lens: list[int]) -> list[bytes]:
+        """Read several flash regions with one pipelined submission pass.
+
+        All reads are submitted back-to-back through the client's
+        submit/reap queue, so USB round-trips overlap instead of
+        serializing each region. BPIO2 frames complete strictly in
+        submission order, so results line up with addrs positionally.
+        """
+        if not self._connected or not self._spi:
+            return [b'' for _ in addrs]
+
+        requests = []
+        spans = []  # (result slot, region offset, region length) per chunk
+        for slot, (address, length) in enumerate(zip(addrs, lens)):
+            for off in range(0, length, self.FLASH_READ_CHUNK):
+                requests.append({
+                    'start_main': True,
+                    'data_write': _flash_read_cmd(address + off),
+                    'bytes_read': min(self.FLASH_READ_CHUNK, length - off),
+                    'stop_main': True,
+                })
+                spans.append((slot, off))
+
+        results = self._client.data_request_batch(requests, window=self.FLASH_READ_INFLIGHT)
+
+        out = [bytearray(length) for length in lens]
+        failed = set()
+        for (slot, off), chunk in zip(spans, results):
+            if not chunk:
+                failed.add(slot)
+            else:
+                out[slot][off:off + len(chunk)] = chunk
+
+        return [b'' if slot in failed else bytes(buf) for slot, buf in enumerate(out)]
 
     # --------------------------------------------------------------------------
     # I2C Interface
@@ -276,8 +475,20 @@ class BusPirateBackend(BusBackend):
 
         # Create I2C interface if needed
         if not self._i2c:
+            from ..pybpio.bpio_i2c import BPIOI2C
             self._i2c = BPIOI2C(self._client)
 
+        mode_config = {
+            'speed': config.speed_hz,
+            'clock_stretch': False,
+        }
+
+        if self._current_mode == "I2C" and self._cached_config_matches("I2C", mode_config):
+            self._i2c.configured = True
+            self._mode_config = mode_config
+            log.info("I2C already configured (cached): %sHz", config.speed_hz)
+            return True
+
         # Configure I2C mode
         success = self._i2c.configure(
             speed=config.speed_hz,
@@ -286,7 +497,9 @@ class BusPirateBackend(BusBackend):
 
         if success:
             self._current_mode = "I2C"
-            print(f"[BusPirate] I2C configured: {config.speed_hz}Hz")
+            self._mode_config = mode_config
+            self.save_state()
+            log.info("I2C configured: %sHz", config.speed_hz)
 
         return success
 
@@ -295,11 +508,11 @@ class BusPirateBackend(BusBackend):
         if not self._connected or not self._i2c:
             return False
 
-        # I2C address is 7-bit, shifted left with W bit (0)
-        addr_byte = (address << 1) & 0xFE
-
+        # Address travels as a header so the payload is never re-copied;
+        # the 7-bit-shifted W-bit form comes from the precomputed table
         result = self._i2c.transfer(
-            write_data=bytes([addr_byte]) + data,
+            write_header=_I2C_WRITE_ADDR[address:address + 1],
+            write_data=data,
             read_bytes=0
         )
         return result is not False
@@ -309,11 +522,8 @@ class BusPirateBackend(BusBackend):
         if not self._connected or not self._i2c:
             return b''
 
-        # I2C address with R bit (1)
-        addr_byte = ((address << 1) | 1) & 0xFF
-
         result = self._i2c.transfer(
-            write_data=bytes([addr_byte]),
+            write_data=_I2C_READ_ADDR[address:address + 1],
             read_bytes=length
         )
         return result if result else b''
@@ -324,10 +534,9 @@ class BusPirateBackend(BusBackend):
             return b''
 
         # Full transaction with repeated start
-        addr_byte = (address << 1) & 0xFE
-
         result = self._i2c.transfer(
-            write_data=bytes([addr_byte]) + write_data,
+            write_header=_I2C_WRITE_ADDR[address:address + 1],
+            write_data=write_data,
             read_bytes=read_len
         )
         return result if result else b''
@@ -357,6 +566,7 @@ class BusPirateBackend(BusBackend):
 
         # Create UART wrapper if needed
         if not self._uart:
+            from ..pybpio.bpio_uart import BPIOUART
             self._uart = BPIOUART(self._client)
 
         # Map parity to boolean (UART uses boolean: True=even, False=none)
@@ -364,6 +574,21 @@ class BusPirateBackend(BusBackend):
         if config.parity in ('E', 'O'):
             parity = True
 
+        mode_config = {
+            'speed': config.baudrate,
+            'data_bits': config.data_bits,
+            'parity': parity,
+            'stop_bits': config.stop_bits,
+            'flow_control': False,
+            'signal_inversion': False,
+        }
+
+        if self._current_mode == "UART" and self._cached_config_matches("UART", mode_config):
+            self._uart.configured = True
+            self._mode_config = mode_config
+            log.info("UART already configured (cached): %s baud", config.baudrate)
+            return True
+
         success = self._uart.configure(
             speed=config.baudrate,
             data_bits=config.data_bits,
@@ -375,7 +600,9 @@ class BusPirateBackend(BusBackend):
 
         if success:
             self._current_mode = "UART"
-            print(f"[BusPirate] UART configured: {config.baudrate} baud, {config.data_bits}{config.parity}{config.stop_bits}")
+            self._mode_config = mode_config
+            self.save_state()
+            log.info("UART configured: %s baud, %s%s%s", config.baudrate, config.data_bits, config.parity, config.stop_bits)
 
         return success
 
@@ -384,7 +611,9 @@ class BusPirateBackend(BusBackend):
         if not self._uart:
             return
 
-        self._uart.write(list(data))
+        # Pass the buffer straight through - exploding it into a list makes
+        # N Python int objects just to be re-joined into bytes downstream
+        self._uart.write(data)
 
     def uart_read(self, length: int, timeout_ms: int = 1000) -> bytes:
         """Read data from UART."""
@@ -432,7 +661,7 @@ class BusPirateBackend(BusBackend):
         results = {}
 
         # 1. Enable PSU
-        print(f"[Scan] Enabling PSU: {power_voltage_mv}mV, {power_current_ma}mA limit...")
+        log.info("Enabling PSU: %smV, %smA limit...", power_voltage_mv, power_current_ma)
         self.set_psu(enabled=True, voltage_mv=power_voltage_mv, current_ma=power_current_ma)
         time.sleep(0.5)  # Give target time to power up
 
@@ -447,15 +676,15 @@ class BusPirateBackend(BusBackend):
         }
         results['psu'] = psu_info
 
-        print(f"[Scan] PSU: {psu_info['measured_voltage_mv']}mV, {psu_info['measured_current_ma']}mA")
+        log.info("PSU: %smV, %smA", psu_info['measured_voltage_mv'], psu_info['measured_current_ma'])
         if psu_info['over_current']:
-            print("[Scan] ⚠️  PSU over-current detected!")
+            log.warning("⚠️  PSU over-current detected!")
 
         # Wait for target to boot
         time.sleep(1)
 
         # 2. Scan I2C
-        print(f"[Scan] Scanning I2C bus...")
+        log.info("Scanning I2C bus...")
         if enable_pullups:
             self.set_pullups(enabled=True)
 
@@ -464,12 +693,12 @@ class BusPirateBackend(BusBackend):
         results['i2c_devices'] = i2c_devices
 
         if i2c_devices:
-            print(f"[Scan] Found {len(i2c_devices)} I2C device(s): {[hex(a) for a in i2c_devices]}")
+            log.info("Found %s I2C device(s): %s", len(i2c_devices), [hex(a) for a in i2c_devices])
         else:
-            print(f"[Scan] No I2C devices found")
+            log.info("No I2C devices found")
 
         # 3. Test SPI
-        print(f"[Scan] Testing SPI interface...")
+        log.info("Testing SPI interface...")
         self.configure_spi(SPIConfig(speed_hz=1_000_000, mode=0))
         flash_id = self.spi_flash_read_id()
 
@@ -482,9 +711,9 @@ class BusPirateBackend(BusBackend):
         }
 
         if spi_detected:
-            print(f"[Scan] SPI flash detected: {flash_id.hex()}")
+            log.info("SPI flash detected: %s", flash_id.hex())
         else:
-            print(f"[Scan] No SPI flash detected")
+            log.info("No SPI flash detected")
 
         # 4. Read pin voltages
         info = self.get_info()
@@ -498,7 +727,7 @@ class BusPirateBackend(BusBackend):
                     pin_voltages[label] = info['adc_mv'][i]
 
             results['pin_voltages'] = pin_voltages
-            print(f"[Scan] Pin voltages captured: {len(pin_voltages)} pins")
+            log.info("Pin voltages captured: %s pins", len(pin_voltages))
 
         # 5. IO status
         io_status = {}
@@ -551,6 +780,45 @@ class BusPirateBackend(BusBackend):
         else:
             return self._client.configuration_request(pullup_disable=True)
 
+    def configure(self, *, psu: Optional[bool] = None, psu_mv: int = 3300,
+                  psu_ma: int = 300, pullup: Optional[bool] = None,
+                  mode: Optional[str] = None,
+                  mode_config: Optional[dict] = None) -> bool:
+        """
+        Apply any combination of PSU, pull-up, and mode settings at once.
+
+        A ConfigurationRequest carries all of these fields, so compound
+        setup (e.g. PSU on + pull-ups on + I2C mode) costs one USB
+        round-trip instead of one per set_psu/set_pullups/configure_* call.
+        Arguments left as None are not touched.
+        """
+        if not self._connected or not self._client:
+            return False
+
+        kwargs = {}
+        if psu is True:
+            kwargs['psu_enable'] = True
+            kwargs['psu_set_mv'] = psu_mv
+            kwargs['psu_set_ma'] = psu_ma
+        elif psu is False:
+            kwargs['psu_disable'] = True
+        if pullup is True:
+            kwargs['pullup_enable'] = True
+        elif pullup is False:
+            kwargs['pullup_disable'] = True
+        if mode is not None:
+            kwargs['mode'] = mode
+            kwargs['mode_configuration'] = mode_config or {}
+        if not kwargs:
+            return True
+
+        success = self._client.configuration_request(**kwargs)
+        if success and mode is not None:
+            self._current_mode = mode
+            self._mode_config = mode_config or {}
+            self.save_state()
+        return success
+
 
     # --------------------------------------------------------------------------
     # Logic Analyzer (SUMP Protocol)
@@ -573,7 +841,7 @@ class BusPirateBackend(BusBackend):
         console_port = self.device.port
 
         try:
-            print(f"[BusPirate] Entering SUMP mode via: {console_port}")
+            log.info("Entering SUMP mode via: %s", console_port)
 
             # Open console port
             ser = serial.Serial(console_port, 115200, timeout=2)
@@ -588,7 +856,7 @@ class BusPirateBackend(BusBackend):
             # Read response
             if ser.in_waiting > 0:
                 response = ser.read(ser.in_waiting)
-                print(f"[BusPirate] Menu: {response.decode('utf-8', errors='ignore')[:100]}")
+                log.debug("Menu: %s", response.decode('utf-8', errors='ignore')[:100])
 
             # Select SUMP mode (option 1 in binmode menu)
             ser.write(b'1\r\n')
@@ -596,7 +864,7 @@ class BusPirateBackend(BusBackend):
 
             if ser.in_waiting > 0:
                 response = ser.read(ser.in_waiting)
-                print(f"[BusPirate] SUMP mode: {response.decode('utf-8', errors='ignore')[:100]}")
+                log.debug("SUMP mode: %s", response.decode('utf-8', errors='ignore')[:100])
 
             ser.close()
             time.sleep(0.5)
@@ -604,7 +872,7 @@ class BusPirateBackend(BusBackend):
             return True
 
         except Exception as e:
-            print(f"[BusPirate] SUMP mode failed: {e}")
+            log.warning("SUMP mode failed: %s", e)
             return False
 
     def capture_logic(
@@ -648,7 +916,7 @@ class BusPirateBackend(BusBackend):
                 return None
 
             # Open serial for SUMP
-            print(f"[BusPirate] Opening SUMP connection: {console_port}")
+            log.info("Opening SUMP connection: %s", console_port)
             sump_serial = serial.Serial(console_port, 115200, timeout=2)
 
             # Import and use SUMP client
@@ -662,16 +930,16 @@ class BusPirateBackend(BusBackend):
             # Check device
             success, device_id = client.identify()
             if not success:
-                print(f"[BusPirate] SUMP not responding: {device_id}")
+                log.warning("SUMP not responding: %s", device_id)
                 sump_serial.close()
                 return None
 
-            print(f"[BusPirate] SUMP device: {device_id}")
+            log.info("SUMP device: %s", device_id)
 
             # Get metadata
             metadata = client.get_metadata()
             if metadata:
-                print(f"[BusPirate] SUMP metadata: {metadata}")
+                log.debug("SUMP metadata: %s", metadata)
 
             # Configure capture
             config = SUMPConfig(
@@ -689,7 +957,7 @@ class BusPirateBackend(BusBackend):
             client.configure(config)
 
             # Capture
-            print(f"[BusPirate] Starting capture...")
+            log.info("Starting capture...")
             capture = client.capture(timeout=timeout)
 
             sump_serial.close()
@@ -706,10 +974,10 @@ class BusPirateBackend(BusBackend):
                 return None
 
         except ImportError:
-            print("[BusPirate] pyserial not installed")
+            log.warning("pyserial not installed")
             return None
         except Exception as e:
-            print(f"[BusPirate] Capture failed: {e}")
+            log.warning("Capture failed: %s", e)
             import traceback
             traceback.print_exc()
             return None
@@ -256,6 +256,79 @@ class DebugBackend(Backend):
         pass
 
 
+class GlitchSweepResults:
+    """Column-oriented results of a glitch parameter sweep.
+
+    Sweep coordinates live in parallel columns (structure-of-arrays) —
+    numpy arrays when numpy is installed, plain lists otherwise — so
+    large sweeps stay compact and feed directly into numpy or
+    matplotlib analysis. Indexing returns a per-point dict, so callers
+    that treat the results as a list of dicts keep working.
+    """
+
+    def __init__(self, width_ns, offset_ns, attempt, status, callback_results=None):
+        self.width_ns = width_ns      # int32, nanoseconds
+        self.offset_ns = offset_ns    # int32, nanoseconds
+        self.attempt = attempt        # int16, attempt number per setting
+        self.status = status          # uint8, 1 if trigger() reported success
+        self.callback_results = callback_results
+
+    def __len__(self):
+        return len(self.width_ns)
+
+    def __getitem__(self, index):
+        result = {
+            "width_ns": int(self.width_ns[index]),
+            "offset_ns": int(self.offset_ns[index]),
+            "attempt": int(self.attempt[index]),
+            "status": int(self.status[index]),
+        }
+        if self.callback_results is not None:
+            result["callback_result"] = self.callback_results[index]
+        return result
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+def _expand_sweep_grid(width_range, width_step, offset_range, offset_step,
+                       attempts_per_setting):
+    """Expand a sweep into parallel width/offset/attempt/status columns.
+
+    Uses numpy when available — a 400k-point sweep is ~3 MB of int
+    columns vs ~80 MB of per-point dicts — but numpy ships only with
+    the buspirate extra, so plain Python lists (and a bytearray for
+    status) provide the same layout when it is absent.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        width_col, offset_col, attempt_col = [], [], []
+        for width in range(width_range[0], width_range[1] + 1, width_step):
+            for offset in range(offset_range[0], offset_range[1] + 1, offset_step):
+                for attempt in range(attempts_per_setting):
+                    width_col.append(width)
+                    offset_col.append(offset)
+                    attempt_col.append(attempt)
+        return width_col, offset_col, attempt_col, bytearray(len(width_col))
+
+    widths = np.arange(width_range[0], width_range[1] + 1, width_step,
+                       dtype=np.int32)
+    offsets = np.arange(offset_range[0], offset_range[1] + 1, offset_step,
+                        dtype=np.int32)
+    attempts = np.arange(attempts_per_setting, dtype=np.int16)
+
+    width_grid, offset_grid, attempt_grid = np.meshgrid(
+        widths, offsets, attempts, indexing='ij')
+    width_col = width_grid.ravel()
+    offset_col = offset_grid.ravel()
+    attempt_col = attempt_grid.ravel()
+
+    return width_col, offset_col, attempt_col, np.zeros(len(width_col),
+                                                        dtype=np.uint8)
+
+
 class GlitchBackend(Backend):
     """Backend supporting fault injection."""
     
@@ -279,13 +352,81 @@ class GlitchBackend(Backend):
         """Disarm the glitcher."""
         pass
 
+    @staticmethod
+    def _make_sweep_kernel(simulate):
+        """Build the sweep driver around a simulate(width, offset) scorer.
+
+        If numba is installed and simulate is itself a numba-compiled
+        function, the driver loop is JIT-compiled too, taking the
+        interpreter out of the per-point cost entirely. Otherwise a plain
+        Python loop with identical semantics is returned.
+        """
+        def kernel(width_col, offset_col, out_status):
+            for i in range(len(width_col)):
+                out_status[i] = 1 if simulate(width_col[i], offset_col[i]) else 0
+
+        # numba Dispatchers expose py_func; only they can be called from
+        # compiled code, so anything else keeps the Python driver
+        if getattr(simulate, 'py_func', None) is not None:
+            try:
+                from numba import njit
+                return njit(cache=True)(kernel)
+            except ImportError:
+                pass
+        return kernel
+
+    def run_simulated_sweep(self, simulate,
+                            width_range: tuple[int, int],
+                            width_step: int,
+                            offset_range: tuple[int, int],
+                            offset_step: int,
+                            attempts_per_setting: int = 1) -> GlitchSweepResults:
+        """
+        Score a parameter grid with a software model instead of hardware.
+
+        Args:
+            simulate: Callable (width, offset) -> bool success predictor;
+                      may be a numba-compiled function for a JIT'd sweep
+            (remaining arguments as in run_glitch_sweep)
+
+        Returns:
+            GlitchSweepResults with status filled from simulate(); no
+            glitches are fired and no device I/O happens
+        """
+        width_col, offset_col, attempt_col, status = _expand_sweep_grid(
+            width_range, width_step, offset_range, offset_step,
+            attempts_per_setting)
+        self._make_sweep_kernel(simulate)(width_col, offset_col, status)
+
+        return GlitchSweepResults(width_col, offset_col, attempt_col, status)
+
+    def trigger_glitch(self, width: int, offset: int) -> dict:
+        """
+        Configure and fire a single glitch at one sweep point.
+
+        Callers iterating a sweep themselves (e.g. to drive a progress bar)
+        use this instead of run_glitch_sweep so results stream back per point.
+
+        Returns:
+            Result dictionary with the parameters and trigger outcome
+        """
+        config = GlitchConfig(width_ns=width, offset_ns=offset)
+        self.configure_glitch(config)
+        fired = self.trigger()
+
+        return {
+            "width_ns": width,
+            "offset_ns": offset,
+            "success": bool(fired),
+        }
+
     def run_glitch_sweep(self,
                          width_range: tuple[int, int],
                          width_step: int,
                          offset_range: tuple[int, int],
                          offset_step: int,
                          attempts_per_setting: int = 10,
-                         callback=None) -> list[dict]:
+                         callback=None) -> GlitchSweepResults:
         """
         Run a parameter sweep for glitch attacks.
 
@@ -298,34 +439,31 @@ class GlitchBackend(Backend):
             callback: Optional function called after each glitch
 
         Returns:
-            List of result dictionaries with parameters and outcomes
+            GlitchSweepResults holding the sweep as parallel columns;
+            indexing it yields per-point result dictionaries
 
         Note: This is a concrete method with default implementation.
               Backends can override for device-specific optimizations.
         """
-        results = []
-
-        for width in range(width_range[0], width_range[1] + 1, width_step):
-            for offset in range(offset_range[0], offset_range[1] + 1, offset_step):
-                config = GlitchConfig(width_ns=width, offset_ns=offset)
+        width_col, offset_col, attempt_col, status = _expand_sweep_grid(
+            width_range, width_step, offset_range, offset_step,
+            attempts_per_setting)
+        callback_results = [] if callback else None
+
+        config = None
+        for index in range(len(width_col)):
+            if config is None or attempt_col[index] == 0:
+                config = GlitchConfig(width_ns=int(width_col[index]),
+                                      offset_ns=int(offset_col[index]))
                 self.configure_glitch(config)
 
-                for attempt in range(attempts_per_setting):
-                    self.trigger()
-
-                    result = {
-                        "width_ns": width,
-                        "offset_ns": offset,
-                        "attempt": attempt,
-                    }
-
-                    if callback:
-                        callback_result = callback(config, attempt)
-                        result["callback_result"] = callback_result
+            status[index] = 1 if self.trigger() else 0
 
-                    results.append(result)
+            if callback:
+                callback_results.append(callback(config, int(attempt_col[index])))
 
-        return results
+        return GlitchSweepResults(width_col, offset_col, attempt_col,
+                                  status, callback_results)
 
 
 # --------------------------------------------------------------------------
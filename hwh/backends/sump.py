@@ -192,12 +192,13 @@ class SUMPClient:
 
                 if token_type & 0x80:
                     # String token
-                    string_data = b''
+                    string_data = bytearray()
                     while True:
                         char = self._serial.read(1)
                         if not char or char == b'\x00':
                             break
                         string_data += char
+                    string_data = bytes(string_data)
 
                     if token_type == 0x01:
                         metadata['device_name'] = string_data.decode('ascii', errors='ignore')
@@ -325,9 +326,10 @@ class SUMPClient:
         # Send RUN command
         self._send_command(SUMPCommand.RUN)
 
-        # Read sample data
+        # Read sample data into a bytearray accumulator - appending to an
+        # immutable bytes object copies the whole buffer each chunk
         start_time = time.time()
-        raw_data = b''
+        raw_data = bytearray()
 
         while len(raw_data) < expected_bytes:
             if time.time() - start_time > timeout:
@@ -338,13 +340,13 @@ class SUMPClient:
 
             chunk = self._serial.read(min(4096, expected_bytes - len(raw_data)))
             if chunk:
-                raw_data += chunk
+                raw_data.extend(chunk)
                 self._log(f"Read {len(chunk)} bytes, total {len(raw_data)}/{expected_bytes}")
 
         self._log(f"Capture complete: {len(raw_data)} bytes")
 
         # Parse raw data into channels
-        return self._parse_capture(raw_data)
+        return self._parse_capture(bytes(raw_data))
 
     def _parse_capture(self, raw_data: bytes) -> SUMPCapture:
         """Parse raw SUMP data into channel samples"""
@@ -12,15 +12,112 @@ from typing import Optional
 import click
 
 from . import __version__
-from .detect import detect, list_devices, print_detected_devices
-from .backends import get_backend, SPIConfig, I2CConfig, GlitchConfig
+
+# detect and the backend registry import every driver stack (pyserial,
+# pyocd, flatbuffers, ...); each command imports exactly what it needs so
+# `hwh --help` stays cheap
+
+
+# --------------------------------------------------------------------------
+# JSON Output
+# --------------------------------------------------------------------------
+
+# orjson's C encoder is several times faster than stdlib json on large
+# result sets (e.g. sweep output); the stdlib fallback uses the same
+# two-space indentation so output is identical either way
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        """Serialize obj to JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        """Serialize obj to JSON bytes."""
+        return json.dumps(obj, indent=2).encode()
+
+
+# --------------------------------------------------------------------------
+# Shared Parameter Types
+# --------------------------------------------------------------------------
+
+class BasedIntParamType(click.ParamType):
+    """Integer option accepting 0x/0o/0b prefixes and underscores."""
+    name = "int"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, int):
+            return value
+        try:
+            return int(value, 0)
+        except ValueError:
+            self.fail(f"{value!r} is not a valid integer", param, ctx)
+
+
+BASED_INT = BasedIntParamType()
+
+
+# JEDEC manufacturer IDs (first byte of the SPI flash ID response)
+SPI_MFG_IDS = {
+    0x01: "Spansion",
+    0x1F: "Atmel",
+    0x20: "Micron",
+    0x89: "Intel",
+    0xBF: "SST",
+    0xC2: "Macronix",
+    0xEF: "Winbond",
+}
 
 
 # --------------------------------------------------------------------------
 # CLI Group
 # --------------------------------------------------------------------------
 
-@click.group()
+class _LazyGroup(click.Group):
+    """Click group that builds subcommand groups on first reference.
+
+    Declaring a group runs every option decorator in it; deferring that
+    work means `hwh detect` never pays for the spi/i2c/debug/glitch
+    declarations. Help output still sees everything via list_commands.
+    """
+
+    def get_command(self, ctx, name):
+        command = super().get_command(ctx, name)
+        if command is None and name in _REGISTRARS:
+            _REGISTRARS[name](self)
+            command = super().get_command(ctx, name)
+        return command
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(_REGISTRARS))
+
+    def format_commands(self, ctx, formatter):
+        # Top-level --help describes unbuilt groups from the static table
+        # below so `hwh --help` never runs their option decorators
+        rows = []
+        for name in self.list_commands(ctx):
+            command = click.Group.get_command(self, ctx, name)
+            if command is not None:
+                if command.hidden:
+                    continue
+                rows.append((name, command.get_short_help_str(limit=45)))
+            else:
+                rows.append((name, _LAZY_SHORT_HELP.get(name, '')))
+        if rows:
+            with formatter.section('Commands'):
+                formatter.write_dl(rows)
+
+
+# Mirrors the group docstrings in the registrars; keep the two in sync
+_LAZY_SHORT_HELP = {
+    'spi': 'SPI flash operations.',
+    'i2c': 'I2C operations.',
+    'debug': 'Debug/SWD operations.',
+    'glitch': 'Fault injection operations.',
+}
+
+
+@click.group(cls=_LazyGroup)
 @click.version_option(version=__version__)
 @click.option('-v', '--verbose', is_flag=True, help='Verbose output')
 @click.pass_context
@@ -42,6 +139,8 @@ def cli(ctx, verbose):
 @click.option('--all', 'show_all', is_flag=True, help='Include unknown devices')
 def detect_cmd(as_json, show_all):
     """Detect connected hardware hacking tools."""
+    from .detect import list_devices, print_detected_devices
+
     devices = list_devices(include_unknown=show_all)
     
     if as_json:
@@ -57,7 +156,7 @@ def detect_cmd(as_json, show_all):
             }
             for d in devices
         ]
-        click.echo(json.dumps(output, indent=2))
+        click.echo(_dumps(output))
     else:
         print_detected_devices()
 
@@ -67,484 +166,404 @@ cli.add_command(detect_cmd, name='detect')
 
 
 # --------------------------------------------------------------------------
-# SPI Commands
+# Lazily Registered Command Groups
 # --------------------------------------------------------------------------
 
-@cli.group()
-def spi():
-    """SPI flash operations."""
-    pass
-
-
-@spi.command('dump')
-@click.option('-d', '--device', help='Device type (buspirate, tigard)')
-@click.option('-o', '--output', type=click.Path(), required=True, help='Output file')
-@click.option('-a', '--address', default='0x0', help='Start address (hex)')
-@click.option('-s', '--size', default='0x100000', help='Size in bytes (hex)')
-@click.option('--speed', default=1000000, help='SPI speed in Hz')
-def spi_dump(device, output, address, size, speed):
-    """Dump SPI flash to file."""
-    # Parse hex values
-    start_addr = int(address, 16) if address.startswith('0x') else int(address)
-    dump_size = int(size, 16) if size.startswith('0x') else int(size)
-    
-    # Find suitable device
-    devices = detect()
+def _register_spi(cli):
+    """Attach the SPI command group to the CLI."""
+    if 'spi' in cli.commands:
+        return
+
+    @cli.group()
+    def spi():
+        """SPI flash operations."""
+        pass
+
+
+    @spi.command('dump')
+    @click.option('-d', '--device', help='Device type (buspirate, tigard)')
+    @click.option('-o', '--output', type=click.File('wb', lazy=True), required=True, help='Output file')
+    @click.option('-a', '--address', type=BASED_INT, default='0x0', help='Start address (hex)')
+    @click.option('-s', '--size', type=BASED_INT, default='0x100000', help='Size in bytes (hex)')
+    @click.option('--speed', default=1000000, help='SPI speed in Hz')
+    @click.option('--chunk-size', type=BASED_INT, default=0x10000,
+                  help='Bytes per read; halves automatically on read failure')
+    def spi_dump(device, output, address, size, speed, chunk_size):
+        """Dump SPI flash to file."""
+        from .backends import get_backend, SPIConfig
+        from .detect import cached_detect, index_by_capability
+
+        start_addr = address
+        dump_size = size
+
+        # Find suitable device
+        devices = cached_detect()
     
-    if device:
-        dev_info = devices.get(device)
-    else:
-        # Auto-select first SPI-capable device
-        for key, dev in devices.items():
-            if 'spi' in dev.capabilities:
-                dev_info = dev
-                click.echo(f"Auto-selected: {dev.name}")
-                break
+        if device:
+            dev_info = devices.get(device)
         else:
-            click.echo("No SPI-capable device found", err=True)
-            sys.exit(1)
-    
-    if not dev_info:
-        click.echo(f"Device '{device}' not found", err=True)
-        sys.exit(1)
+            # Auto-select first SPI-capable device
+            dev_info = index_by_capability(devices).get('spi')
+            if dev_info:
+                click.echo(f"Auto-selected: {dev_info.name}")
+            else:
+                click.echo("No SPI-capable device found", err=True)
+                sys.exit(1)
     
-    backend = get_backend(dev_info)
-    if not backend:
-        click.echo(f"No backend for {dev_info.device_type}", err=True)
-        sys.exit(1)
+        if not dev_info:
+            click.echo(f"Device '{device}' not found", err=True)
+            sys.exit(1)
     
-    with backend:
-        # Configure SPI
-        config = SPIConfig(speed_hz=speed)
-        if not backend.configure_spi(config):
-            click.echo("SPI configuration failed", err=True)
+        backend = get_backend(dev_info)
+        if not backend:
+            click.echo(f"No backend for {dev_info.device_type}", err=True)
             sys.exit(1)
+    
+        with backend:
+            # Configure SPI
+            config = SPIConfig(speed_hz=speed)
+            if not backend.configure_spi(config):
+                click.echo("SPI configuration failed", err=True)
+                sys.exit(1)
         
-        # Read flash ID first
-        flash_id = backend.spi_flash_read_id()
-        click.echo(f"Flash ID: {flash_id.hex()}")
-        
-        # Dump flash
-        click.echo(f"Reading {dump_size} bytes from 0x{start_addr:06x}...")
-        
-        data = b''
-        chunk_size = 4096
+            # Read flash ID first
+            flash_id = backend.spi_flash_read_id()
+            click.echo(f"Flash ID: {flash_id.hex()}")
         
-        with click.progressbar(length=dump_size, label='Dumping') as bar:
-            while len(data) < dump_size:
-                remaining = dump_size - len(data)
-                chunk = min(chunk_size, remaining)
-                
-                chunk_data = backend.spi_flash_read(start_addr + len(data), chunk)
-                if not chunk_data:
-                    click.echo("\nRead error", err=True)
-                    break
-                
-                data += chunk_data
-                bar.update(len(chunk_data))
+            # Dump flash
+            click.echo(f"Reading {dump_size} bytes from 0x{start_addr:06x}...")
         
-        # Write to file
-        Path(output).write_bytes(data)
-        click.echo(f"Written {len(data)} bytes to {output}")
-
-
-@spi.command('id')
-@click.option('-d', '--device', help='Device type')
-def spi_id(device):
-    """Read SPI flash JEDEC ID."""
-    devices = detect()
+            # Stream each chunk straight to disk - holding a multi-MB NOR
+            # image in memory buys nothing, and the kernel overlaps
+            # writeback with the next SPI read. Large chunks amortize the
+            # fixed per-transaction USB overhead; the 0x03 read command
+            # streams for as long as the host keeps clocking.
+            pos = 0
+
+            with click.progressbar(length=dump_size, label='Dumping') as bar:
+                while pos < dump_size:
+                    chunk = min(chunk_size, dump_size - pos)
+
+                    chunk_data = backend.spi_flash_read(start_addr + pos, chunk)
+                    if not chunk_data:
+                        # Back off for backends with smaller FIFOs
+                        if chunk_size > 1024:
+                            chunk_size //= 2
+                            continue
+                        click.echo("\nRead error", err=True)
+                        break
+
+                    output.write(chunk_data)
+                    pos += len(chunk_data)
+                    bar.update(len(chunk_data))
+
+            output.close()
+            click.echo(f"Written {pos} bytes to {output.name}")
+
+
+    @spi.command('id')
+    @click.option('-d', '--device', help='Device type')
+    def spi_id(device):
+        """Read SPI flash JEDEC ID."""
+        from .backends import get_backend, SPIConfig
+        from .detect import cached_detect, index_by_capability
+
+        devices = cached_detect()
     
-    # Find device
-    dev_info = None
-    if device:
-        dev_info = devices.get(device)
-    else:
-        for key, dev in devices.items():
-            if 'spi' in dev.capabilities:
-                dev_info = dev
-                break
+        # Find device
+        if device:
+            dev_info = devices.get(device)
+        else:
+            dev_info = index_by_capability(devices).get('spi')
     
-    if not dev_info:
-        click.echo("No SPI device found", err=True)
-        sys.exit(1)
+        if not dev_info:
+            click.echo("No SPI device found", err=True)
+            sys.exit(1)
     
-    backend = get_backend(dev_info)
-    with backend:
-        backend.configure_spi(SPIConfig())
-        flash_id = backend.spi_flash_read_id()
+        backend = get_backend(dev_info)
+        with backend:
+            backend.configure_spi(SPIConfig())
+            flash_id = backend.spi_flash_read_id()
         
-        if flash_id:
-            click.echo(f"JEDEC ID: {flash_id.hex()}")
-            # Decode common IDs
-            if flash_id[0] == 0xEF:
-                click.echo("  Manufacturer: Winbond")
-            elif flash_id[0] == 0xC2:
-                click.echo("  Manufacturer: Macronix")
-            elif flash_id[0] == 0x20:
-                click.echo("  Manufacturer: Micron")
+            if flash_id:
+                click.echo(f"JEDEC ID: {flash_id.hex()}")
+                # Decode common IDs
+                mfg = SPI_MFG_IDS.get(flash_id[0])
+                if mfg:
+                    click.echo(f"  Manufacturer: {mfg}")
 
 
-# --------------------------------------------------------------------------
-# I2C Commands
-# --------------------------------------------------------------------------
+def _register_i2c(cli):
+    """Attach the I2C command group to the CLI."""
+    if 'i2c' in cli.commands:
+        return
+
+    @cli.group()
+    def i2c():
+        """I2C operations."""
+        pass
 
-@cli.group()
-def i2c():
-    """I2C operations."""
-    pass
 
+    @i2c.command('scan')
+    @click.option('-d', '--device', help='Device type')
+    def i2c_scan(device):
+        """Scan I2C bus for devices."""
+        from .backends import get_backend, I2CConfig
+        from .detect import cached_detect, index_by_capability
 
-@i2c.command('scan')
-@click.option('-d', '--device', help='Device type')
-def i2c_scan(device):
-    """Scan I2C bus for devices."""
-    devices = detect()
+        devices = cached_detect()
     
-    dev_info = None
-    if device:
-        dev_info = devices.get(device)
-    else:
-        for key, dev in devices.items():
-            if 'i2c' in dev.capabilities:
-                dev_info = dev
-                break
+        if device:
+            dev_info = devices.get(device)
+        else:
+            dev_info = index_by_capability(devices).get('i2c')
     
-    if not dev_info:
-        click.echo("No I2C device found", err=True)
-        sys.exit(1)
+        if not dev_info:
+            click.echo("No I2C device found", err=True)
+            sys.exit(1)
     
-    backend = get_backend(dev_info)
-    with backend:
-        backend.configure_i2c(I2CConfig())
+        backend = get_backend(dev_info)
+        with backend:
+            backend.configure_i2c(I2CConfig())
         
-        found = backend.i2c_scan()
+            found = backend.i2c_scan()
         
-        if found:
-            click.echo(f"Found {len(found)} device(s):")
-            for addr in found:
-                click.echo(f"  0x{addr:02x}")
-        else:
-            click.echo("No devices found")
-
-
-# --------------------------------------------------------------------------
-# Debug Commands
-# --------------------------------------------------------------------------
-
-@cli.group()
-def debug():
-    """Debug/SWD operations."""
-    pass
-
-
-@debug.command('dump')
-@click.option('-d', '--device', help='Device type (stlink)')
-@click.option('-o', '--output', type=click.Path(), required=True, help='Output file')
-@click.option('-a', '--address', required=True, help='Start address (hex)')
-@click.option('-s', '--size', required=True, help='Size in bytes (hex)')
-@click.option('-t', '--target', default='auto', help='Target chip name')
-def debug_dump(device, output, address, size, target):
-    """Dump firmware via SWD/JTAG."""
-    start_addr = int(address, 16) if address.startswith('0x') else int(address)
-    dump_size = int(size, 16) if size.startswith('0x') else int(size)
-    
-    devices = detect()
+            if found:
+                click.echo(f"Found {len(found)} device(s):")
+                for addr in found:
+                    click.echo(f"  0x{addr:02x}")
+            else:
+                click.echo("No devices found")
+
+
+def _register_debug(cli):
+    """Attach the debug/SWD command group to the CLI."""
+    if 'debug' in cli.commands:
+        return
+
+    @cli.group()
+    def debug():
+        """Debug/SWD operations."""
+        pass
+
+
+    @debug.command('dump')
+    @click.option('-d', '--device', help='Device type (stlink)')
+    @click.option('-o', '--output', type=click.File('wb', lazy=True), required=True, help='Output file')
+    @click.option('-a', '--address', type=BASED_INT, required=True, help='Start address (hex)')
+    @click.option('-s', '--size', type=BASED_INT, required=True, help='Size in bytes (hex)')
+    @click.option('-t', '--target', default='auto', help='Target chip name')
+    def debug_dump(device, output, address, size, target):
+        """Dump firmware via SWD/JTAG."""
+        from .backends import get_backend
+        from .detect import cached_detect, index_by_capability
+
+        start_addr = address
+        dump_size = size
+
+        devices = cached_detect()
     
-    dev_info = None
-    if device:
-        dev_info = devices.get(device)
-    else:
-        for key, dev in devices.items():
-            if 'swd' in dev.capabilities or 'debug' in dev.capabilities:
-                dev_info = dev
-                break
-    
-    if not dev_info:
-        click.echo("No debug probe found", err=True)
-        sys.exit(1)
+        if device:
+            dev_info = devices.get(device)
+        else:
+            idx = index_by_capability(devices)
+            dev_info = idx.get('swd') or idx.get('debug')
     
-    backend = get_backend(dev_info)
-    with backend:
-        if not backend.connect_target(target):
-            click.echo("Target connection failed", err=True)
+        if not dev_info:
+            click.echo("No debug probe found", err=True)
             sys.exit(1)
+    
+        backend = get_backend(dev_info)
+        with backend:
+            if not backend.connect_target(target):
+                click.echo("Target connection failed", err=True)
+                sys.exit(1)
         
-        backend.halt()
+            backend.halt()
         
-        click.echo(f"Dumping {dump_size} bytes from 0x{start_addr:08x}...")
-        data = backend.dump_firmware(start_addr, dump_size)
+            click.echo(f"Dumping {dump_size} bytes from 0x{start_addr:08x}...")
+            data = backend.dump_firmware(start_addr, dump_size)
         
-        Path(output).write_bytes(data)
-        click.echo(f"Written {len(data)} bytes to {output}")
+            output.write(data)
+            output.close()
+            click.echo(f"Written {len(data)} bytes to {output.name}")
+
 
+    @debug.command('regs')
+    @click.option('-d', '--device', help='Device type')
+    @click.option('-t', '--target', default='auto', help='Target chip')
+    def debug_regs(device, target):
+        """Read CPU registers."""
+        from .backends import get_backend
+        from .detect import cached_detect, index_by_capability
 
-@debug.command('regs')
-@click.option('-d', '--device', help='Device type')
-@click.option('-t', '--target', default='auto', help='Target chip')
-def debug_regs(device, target):
-    """Read CPU registers."""
-    devices = detect()
+        devices = cached_detect()
     
-    dev_info = None
-    if device:
-        dev_info = devices.get(device)
-    else:
-        for key, dev in devices.items():
-            if 'debug' in dev.capabilities:
-                dev_info = dev
-                break
+        if device:
+            dev_info = devices.get(device)
+        else:
+            dev_info = index_by_capability(devices).get('debug')
     
-    if not dev_info:
-        click.echo("No debug probe found", err=True)
-        sys.exit(1)
+        if not dev_info:
+            click.echo("No debug probe found", err=True)
+            sys.exit(1)
     
-    backend = get_backend(dev_info)
-    with backend:
-        backend.connect_target(target)
-        backend.halt()
+        backend = get_backend(dev_info)
+        with backend:
+            backend.connect_target(target)
+            backend.halt()
         
-        regs = backend.read_registers()
-        for name, value in regs.items():
-            click.echo(f"  {name:6s}: 0x{value:08x}")
-
-
-# --------------------------------------------------------------------------
-# Glitch Commands
-# --------------------------------------------------------------------------
-
-@cli.group()
-def glitch():
-    """Fault injection operations."""
-    pass
-
-
-@glitch.command('single')
-@click.option('-d', '--device', help='Device type (bolt, faultycat)')
-@click.option('-w', '--width', default=100, help='Glitch width in ns')
-@click.option('-o', '--offset', default=0, help='Offset after trigger in ns')
-def glitch_single(device, width, offset):
-    """Trigger a single glitch."""
-    devices = detect()
+            regs = backend.read_registers()
+            # One echo for the whole dump instead of one per register
+            click.echo("\n".join(
+                f"  {name:6s}: 0x{value:08x}" for name, value in regs.items()
+            ))
+
+
+def _register_glitch(cli):
+    """Attach the glitch command group to the CLI."""
+    if 'glitch' in cli.commands:
+        return
+
+    @cli.group()
+    def glitch():
+        """Fault injection operations."""
+        pass
+
+
+    @glitch.command('single')
+    @click.option('-d', '--device', help='Device type (bolt, faultycat)')
+    @click.option('-w', '--width', default=100, help='Glitch width in ns')
+    @click.option('-o', '--offset', default=0, help='Offset after trigger in ns')
+    def glitch_single(device, width, offset):
+        """Trigger a single glitch."""
+        from .backends import get_backend, GlitchConfig
+        from .detect import cached_detect, index_by_capability
+
+        devices = cached_detect()
     
-    dev_info = None
-    if device:
-        dev_info = devices.get(device)
-    else:
-        for key, dev in devices.items():
-            if 'glitch' in dev.capabilities:
-                dev_info = dev
-                break
+        if device:
+            dev_info = devices.get(device)
+        else:
+            dev_info = index_by_capability(devices).get('glitch')
     
-    if not dev_info:
-        click.echo("No glitcher found", err=True)
-        sys.exit(1)
+        if not dev_info:
+            click.echo("No glitcher found", err=True)
+            sys.exit(1)
     
-    backend = get_backend(dev_info)
-    with backend:
-        config = GlitchConfig(width_ns=width, offset_ns=offset)
-        backend.configure_glitch(config)
-        backend.trigger()
-        click.echo(f"Glitch triggered: {width}ns width, {offset}ns offset")
-
-
-@glitch.command('sweep')
-@click.option('-d', '--device', help='Device type')
-@click.option('--width-min', default=50, help='Min width (ns)')
-@click.option('--width-max', default=500, help='Max width (ns)')
-@click.option('--width-step', default=10, help='Width step (ns)')
-@click.option('--offset-min', default=0, help='Min offset (ns)')
-@click.option('--offset-max', default=1000, help='Max offset (ns)')
-@click.option('--offset-step', default=50, help='Offset step (ns)')
-@click.option('--attempts', default=5, help='Attempts per setting')
-@click.option('-o', '--output', type=click.Path(), help='Save results to JSON')
-def glitch_sweep(device, width_min, width_max, width_step, 
-                 offset_min, offset_max, offset_step, attempts, output):
-    """Run glitch parameter sweep."""
-    devices = detect()
+        backend = get_backend(dev_info)
+        with backend:
+            config = GlitchConfig(width_ns=width, offset_ns=offset)
+            backend.configure_glitch(config)
+            backend.trigger()
+            click.echo(f"Glitch triggered: {width}ns width, {offset}ns offset")
+
+
+    @glitch.command('sweep')
+    @click.option('-d', '--device', help='Device type')
+    @click.option('--width-min', default=50, help='Min width (ns)')
+    @click.option('--width-max', default=500, help='Max width (ns)')
+    @click.option('--width-step', default=10, help='Width step (ns)')
+    @click.option('--offset-min', default=0, help='Min offset (ns)')
+    @click.option('--offset-max', default=1000, help='Max offset (ns)')
+    @click.option('--offset-step', default=50, help='Offset step (ns)')
+    @click.option('--attempts', default=5, help='Attempts per setting')
+    @click.option('-o', '--output', type=click.Path(), help='Save results to JSON')
+    def glitch_sweep(device, width_min, width_max, width_step, 
+                     offset_min, offset_max, offset_step, attempts, output):
+        """Run glitch parameter sweep."""
+        from .backends import get_backend
+        from .detect import cached_detect, index_by_capability
+
+        devices = cached_detect()
     
-    dev_info = None
-    if device:
-        dev_info = devices.get(device)
-    else:
-        for key, dev in devices.items():
-            if 'glitch' in dev.capabilities:
-                dev_info = dev
-                break
+        if device:
+            dev_info = devices.get(device)
+        else:
+            dev_info = index_by_capability(devices).get('glitch')
     
-    if not dev_info:
-        click.echo("No glitcher found", err=True)
-        sys.exit(1)
+        if not dev_info:
+            click.echo("No glitcher found", err=True)
+            sys.exit(1)
     
-    backend = get_backend(dev_info)
-    with backend:
-        # Calculate total iterations
-        width_steps = (width_max - width_min) // width_step + 1
-        offset_steps = (offset_max - offset_min) // offset_step + 1
-        total = width_steps * offset_steps * attempts
-        
-        click.echo(f"Running {total} glitch attempts...")
+        backend = get_backend(dev_info)
+        with backend:
+            widths = range(width_min, width_max + 1, width_step)
+            offsets = range(offset_min, offset_max + 1, offset_step)
+            total = len(widths) * len(offsets) * attempts
+
+            click.echo(f"Running {total} glitch attempts...")
+
+            # Iterate point-by-point so progress tracks real glitch I/O and
+            # Ctrl-C stops the sweep without losing already-collected results
+            results = []
+            with click.progressbar(length=total, label='Sweeping') as bar:
+                for width in widths:
+                    for offset in offsets:
+                        for attempt in range(attempts):
+                            result = backend.trigger_glitch(width, offset)
+                            result['attempt'] = attempt
+                            results.append(result)
+                            bar.update(1)
+
+            click.echo(f"Completed {len(results)} glitches")
         
-        results = backend.run_glitch_sweep(
-            width_range=(width_min, width_max),
-            width_step=width_step,
-            offset_range=(offset_min, offset_max),
-            offset_step=offset_step,
-            attempts_per_setting=attempts
-        )
-        
-        click.echo(f"Completed {len(results)} glitches")
-        
-        if output:
-            Path(output).write_text(json.dumps(results, indent=2))
-            click.echo(f"Results saved to {output}")
+            if output:
+                Path(output).write_bytes(_dumps(results))
+                click.echo(f"Results saved to {output}")
 
 
-# --------------------------------------------------------------------------
-# Glitch Commands
-# --------------------------------------------------------------------------
 
-@cli.group()
-def glitch():
-    """Voltage glitching operations."""
-    pass
+    @glitch.command('campaign')
+    @click.argument('config-file', type=click.Path(exists=True))
+    @click.option('-d', '--device', help='Device type (bolt, faultycat)')
+    def glitch_campaign(config_file, device):
+        """Run automated glitching campaign from config file."""
+        import asyncio
 
+        from .backends import get_backend
+        from .detect import cached_detect, index_by_capability
+        from hwh.tui.campaign import run_campaign
 
-@glitch.command('single')
-@click.option('-d', '--device', help='Device type (bolt, faultycat)')
-@click.option('-w', '--width', type=float, default=350.0, help='Glitch width in nanoseconds')
-@click.option('-o', '--offset', type=float, default=0.0, help='Trigger offset in nanoseconds')
-def glitch_single(device, width, offset):
-    """Trigger a single glitch."""
-    devices = detect()
+        devices = cached_detect()
 
-    # Find glitch-capable device
-    if device:
-        dev_info = devices.get(device)
-    else:
-        for key, dev in devices.items():
-            if 'voltage_glitch' in dev.capabilities:
-                dev_info = dev
-                break
+        # Find glitch-capable device
+        if device:
+            dev_info = devices.get(device)
         else:
-            click.echo("No glitching device found!", err=True)
-            return 1
+            dev_info = index_by_capability(devices).get('voltage_glitch')
+            if not dev_info:
+                click.echo("No glitching device found!", err=True)
+                return 1
 
-    if not dev_info:
-        click.echo(f"Device '{device}' not found!", err=True)
-        return 1
+        backend = get_backend(dev_info)
 
-    backend = get_backend(dev_info)
-
-    with backend:
-        cfg = GlitchConfig(width_ns=width, offset_ns=offset)
-        backend.configure_glitch(cfg)
-
-        click.echo(f"Triggering glitch: {width:.0f}ns width, {offset:.0f}ns offset")
-        backend.trigger()
-        click.echo("✓ Glitch sent")
-
-
-@glitch.command('sweep')
-@click.option('-d', '--device', help='Device type (bolt, faultycat)')
-@click.option('--width-min', type=float, default=50.0, help='Minimum glitch width (ns)')
-@click.option('--width-max', type=float, default=1000.0, help='Maximum glitch width (ns)')
-@click.option('--width-step', type=float, default=50.0, help='Width increment (ns)')
-@click.option('--offset-min', type=float, default=0.0, help='Minimum offset (ns)')
-@click.option('--offset-max', type=float, default=1000.0, help='Maximum offset (ns)')
-@click.option('--offset-step', type=float, default=100.0, help='Offset increment (ns)')
-@click.option('--delay', type=float, default=0.01, help='Delay between glitches (seconds)')
-def glitch_sweep(device, width_min, width_max, width_step,
-                 offset_min, offset_max, offset_step, delay):
-    """Sweep glitch parameters."""
-    import time
-
-    devices = detect()
-
-    # Find glitch-capable device
-    if device:
-        dev_info = devices.get(device)
-    else:
-        for key, dev in devices.items():
-            if 'voltage_glitch' in dev.capabilities:
-                dev_info = dev
-                break
-        else:
-            click.echo("No glitching device found!", err=True)
-            return 1
-
-    backend = get_backend(dev_info)
-
-    with backend:
-        click.echo(f"Parameter sweep:")
-        click.echo(f"  Width: {width_min}-{width_max}ns (step {width_step}ns)")
-        click.echo(f"  Offset: {offset_min}-{offset_max}ns (step {offset_step}ns)")
-        click.echo(f"  Delay: {delay}s between glitches")
+        click.echo(f"Running campaign from: {config_file}")
         click.echo()
 
-        width = width_min
-        total = 0
-
-        while width <= width_max:
-            offset = offset_min
-
-            while offset <= offset_max:
-                cfg = GlitchConfig(width_ns=width, offset_ns=offset)
-                backend.configure_glitch(cfg)
-                backend.trigger()
+        # Run campaign
+        stats = asyncio.run(run_campaign(backend, config_file, log_callback=click.echo))
 
-                total += 1
-                click.echo(f"[{total:4d}] width={width:5.0f}ns offset={offset:5.0f}ns", nl=False)
-                click.echo('\r', nl=False)  # Overwrite same line
-
-                time.sleep(delay)
-                offset += offset_step
-
-            width += width_step
-
-        click.echo(f"\n✓ Sweep complete: {total} glitches sent")
-
-
-@glitch.command('campaign')
-@click.argument('config-file', type=click.Path(exists=True))
-@click.option('-d', '--device', help='Device type (bolt, faultycat)')
-def glitch_campaign(config_file, device):
-    """Run automated glitching campaign from config file."""
-    import asyncio
-    from hwh.tui.campaign import run_campaign
-
-    devices = detect()
+        # Display results
+        click.echo()
+        click.echo("Campaign complete!")
+        click.echo(f"  Glitches sent: {stats.glitches_sent}")
+        click.echo(f"  Elapsed time: {stats.elapsed_seconds:.1f}s")
+        click.echo(f"  Rate: {stats.glitches_per_second:.1f} glitches/sec")
 
-    # Find glitch-capable device
-    if device:
-        dev_info = devices.get(device)
-    else:
-        for key, dev in devices.items():
-            if 'voltage_glitch' in dev.capabilities:
-                dev_info = dev
-                break
+        if stats.success:
+            click.echo("  Status: SUCCESS ✓")
         else:
-            click.echo("No glitching device found!", err=True)
-            return 1
-
-    backend = get_backend(dev_info)
+            click.echo("  Status: No success detected")
 
-    click.echo(f"Running campaign from: {config_file}")
-    click.echo()
 
-    # Run campaign
-    stats = asyncio.run(run_campaign(backend, config_file, log_callback=click.echo))
-
-    # Display results
-    click.echo()
-    click.echo("Campaign complete!")
-    click.echo(f"  Glitches sent: {stats.glitches_sent}")
-    click.echo(f"  Elapsed time: {stats.elapsed_seconds:.1f}s")
-    click.echo(f"  Rate: {stats.glitches_per_second:.1f} glitches/sec")
-
-    if stats.success:
-        click.echo("  Status: SUCCESS ✓")
-    else:
-        click.echo("  Status: No success detected")
+# Group name -> registrar; consulted by _LazyGroup on first reference
+_REGISTRARS = {
+    'spi': _register_spi,
+    'i2c': _register_i2c,
+    'debug': _register_debug,
+    'glitch': _register_glitch,
+}
 
 
 # --------------------------------------------------------------------------
@@ -576,8 +595,11 @@ def shell():
         # Import useful things into namespace
         from hwh import detect, list_devices, get_backend
         from hwh.backends import SPIConfig, I2CConfig, UARTConfig, GlitchConfig
+        from hwh.detect import cached_detect
 
-        devices = detect()
+        # Reuse a recent scan (e.g. from a preceding hwh detect in the same
+        # process) instead of re-walking the USB tree before the prompt
+        devices = cached_detect(max_age=5.0)
 
         click.echo("hwh Interactive Shell")
         click.echo("=" * 40)
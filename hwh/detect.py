@@ -5,7 +5,7 @@ Scans USB and serial ports to identify known devices.
 """
 
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
 from pathlib import Path
 
@@ -13,7 +13,7 @@ from pathlib import Path
 # Known Device Definitions
 # --------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class DeviceInfo:
     """Metadata about a detected device."""
     name: str
@@ -23,47 +23,58 @@ class DeviceInfo:
     vid: Optional[int] = None
     pid: Optional[int] = None
     serial: Optional[str] = None
-    capabilities: list[str] = field(default_factory=list)
+    capabilities: tuple[str, ...] = ()
 
 
+# Shared, immutable capability sets: table lookups hand out the same
+# tuple for every detect() call instead of copying a fresh list
+_CAPS_DEBUG = ("swd", "jtag", "debug")
+_CAPS_DEBUG_UART = ("swd", "jtag", "debug", "uart")
+_CAPS_BUSPIRATE = ("spi", "i2c", "uart", "1wire", "jtag", "psu")
+_CAPS_BUSPIRATE_LEGACY = ("spi", "i2c", "uart", "1wire")
+_CAPS_TIGARD = ("spi", "i2c", "uart", "jtag", "swd")
+_CAPS_BOLT = ("voltage_glitch", "logic_analyzer", "power_analysis")
+_CAPS_UART = ("uart",)
+_CAPS_UNKNOWN = ("unknown",)
+
 # USB VID:PID mappings for known devices
 # Format: (VID, PID): (name, device_type, capabilities)
 KNOWN_USB_DEVICES = {
     # ST-Link variants
-    (0x0483, 0x3748): ("ST-Link V2", "stlink", ["swd", "jtag", "debug"]),
-    (0x0483, 0x374B): ("ST-Link V2-1", "stlink", ["swd", "jtag", "debug"]),
-    (0x0483, 0x374D): ("ST-Link V3 Mini", "stlink", ["swd", "jtag", "debug"]),
-    (0x0483, 0x374E): ("ST-Link V3", "stlink", ["swd", "jtag", "debug"]),
-    (0x0483, 0x374F): ("ST-Link V3", "stlink", ["swd", "jtag", "debug"]),
-    (0x0483, 0x3752): ("ST-Link V2.1", "stlink", ["swd", "jtag", "debug"]),
-    (0x0483, 0x3753): ("ST-Link V3", "stlink", ["swd", "jtag", "debug"]),
-    
+    (0x0483, 0x3748): ("ST-Link V2", "stlink", _CAPS_DEBUG),
+    (0x0483, 0x374B): ("ST-Link V2-1", "stlink", _CAPS_DEBUG),
+    (0x0483, 0x374D): ("ST-Link V3 Mini", "stlink", _CAPS_DEBUG),
+    (0x0483, 0x374E): ("ST-Link V3", "stlink", _CAPS_DEBUG),
+    (0x0483, 0x374F): ("ST-Link V3", "stlink", _CAPS_DEBUG),
+    (0x0483, 0x3752): ("ST-Link V2.1", "stlink", _CAPS_DEBUG),
+    (0x0483, 0x3753): ("ST-Link V3", "stlink", _CAPS_DEBUG),
+
     # Black Magic Probe variants
-    (0x1D50, 0x6018): ("Black Magic Probe", "blackmagic", ["swd", "jtag", "debug", "uart"]),
-    (0x1D50, 0x6017): ("Black Magic Probe (DFU)", "blackmagic_dfu", ["dfu"]),
-    (0x1D50, 0x6024): ("Black Magic Probe V2.3", "blackmagic", ["swd", "jtag", "debug", "uart"]),
-    
+    (0x1D50, 0x6018): ("Black Magic Probe", "blackmagic", _CAPS_DEBUG_UART),
+    (0x1D50, 0x6017): ("Black Magic Probe (DFU)", "blackmagic_dfu", ("dfu",)),
+    (0x1D50, 0x6024): ("Black Magic Probe V2.3", "blackmagic", _CAPS_DEBUG_UART),
+
     # Bus Pirate variants
-    (0x1209, 0x7331): ("Bus Pirate 5/6", "buspirate", ["spi", "i2c", "uart", "1wire", "jtag", "psu"]),
-    (0x2047, 0x0900): ("Bus Pirate 5", "buspirate", ["spi", "i2c", "uart", "1wire", "jtag", "psu"]),
-    (0x2047, 0x0901): ("Bus Pirate 6", "buspirate", ["spi", "i2c", "uart", "1wire", "jtag", "psu"]),
-    (0x0403, 0x6001): ("Bus Pirate v3/v4", "buspirate_legacy", ["spi", "i2c", "uart", "1wire"]),
-    
+    (0x1209, 0x7331): ("Bus Pirate 5/6", "buspirate", _CAPS_BUSPIRATE),
+    (0x2047, 0x0900): ("Bus Pirate 5", "buspirate", _CAPS_BUSPIRATE),
+    (0x2047, 0x0901): ("Bus Pirate 6", "buspirate", _CAPS_BUSPIRATE),
+    (0x0403, 0x6001): ("Bus Pirate v3/v4", "buspirate_legacy", _CAPS_BUSPIRATE_LEGACY),
+
     # Tigard (FTDI FT2232H)
-    (0x0403, 0x6010): ("Tigard / FT2232H", "tigard", ["spi", "i2c", "uart", "jtag", "swd"]),
+    (0x0403, 0x6010): ("Tigard / FT2232H", "tigard", _CAPS_TIGARD),
 
     # RP2040-based devices (Curious Bolt, FaultyCat)
     # Note: Same VID:PID, requires runtime identification via serial probing
-    (0x2E8A, 0x000A): ("RP2040 Device", "rp2040_unknown", ["unknown"]),
-    (0x2E8A, 0x0003): ("RP2040 Device (alt)", "rp2040_unknown", ["unknown"]),
+    (0x2E8A, 0x000A): ("RP2040 Device", "rp2040_unknown", _CAPS_UNKNOWN),
+    (0x2E8A, 0x0003): ("RP2040 Device (alt)", "rp2040_unknown", _CAPS_UNKNOWN),
 
     # Curious Bolt (voltage glitching, logic analyzer, power analysis)
-    (0xCAFE, 0x4002): ("Curious Bolt", "bolt", ["voltage_glitch", "logic_analyzer", "power_analysis"]),
+    (0xCAFE, 0x4002): ("Curious Bolt", "bolt", _CAPS_BOLT),
 
     # Common UART adapters
-    (0x1A86, 0x7523): ("CH340 UART", "uart", ["uart"]),
-    (0x10C4, 0xEA60): ("CP2102 UART", "uart", ["uart"]),
-    (0x067B, 0x2303): ("PL2303 UART", "uart", ["uart"]),
+    (0x1A86, 0x7523): ("CH340 UART", "uart", _CAPS_UART),
+    (0x10C4, 0xEA60): ("CP2102 UART", "uart", _CAPS_UART),
+    (0x067B, 0x2303): ("PL2303 UART", "uart", _CAPS_UART),
 }
 
 # Serial port patterns for fallback detection
@@ -78,30 +89,56 @@ SERIAL_PATTERNS = {
 # Detection Functions
 # --------------------------------------------------------------------------
 
+# Serial-number descriptors are fetched with synchronous USB control
+# transfers (1-10 ms each); cache them per physical device so repeated
+# detect() calls skip the string reads entirely
+_SERIAL_STRING_TTL = 5.0
+_serial_string_cache: dict[tuple, tuple[float, Optional[str]]] = {}
+
+
+def _usb_serial_string(dev) -> Optional[str]:
+    """Read (or reuse) the iSerialNumber string for a pyusb device."""
+    import time
+
+    import usb.core
+    import usb.util
+
+    key = (dev.bus, dev.address, dev.idVendor, dev.idProduct)
+    now = time.monotonic()
+
+    cached = _serial_string_cache.get(key)
+    if cached is not None and now - cached[0] < _SERIAL_STRING_TTL:
+        return cached[1]
+
+    serial = None
+    try:
+        serial = usb.util.get_string(dev, dev.iSerialNumber) if dev.iSerialNumber else None
+    except (usb.core.USBError, ValueError):
+        pass
+
+    _serial_string_cache[key] = (now, serial)
+    return serial
+
+
 def _detect_usb_devices() -> list[DeviceInfo]:
     """Detect devices via USB enumeration using pyusb."""
     devices = []
-    
+
     try:
         import usb.core
         import usb.util
     except ImportError:
         # pyusb not installed, skip USB detection
         return devices
-    
+
     for dev in usb.core.find(find_all=True):
         vid_pid = (dev.idVendor, dev.idProduct)
-        
+
         if vid_pid in KNOWN_USB_DEVICES:
             name, device_type, caps = KNOWN_USB_DEVICES[vid_pid]
-            
-            # Try to get serial number
-            serial = None
-            try:
-                serial = usb.util.get_string(dev, dev.iSerialNumber) if dev.iSerialNumber else None
-            except (usb.core.USBError, ValueError):
-                pass
-            
+
+            serial = _usb_serial_string(dev)
+
             devices.append(DeviceInfo(
                 name=name,
                 device_type=device_type,
@@ -109,49 +146,70 @@ def _detect_usb_devices() -> list[DeviceInfo]:
                 pid=dev.idProduct,
                 serial=serial,
                 usb_path=f"{dev.bus}:{dev.address}",
-                capabilities=caps.copy(),
+                capabilities=caps,
             ))
     
     return devices
 
 
-def _detect_serial_devices() -> list[DeviceInfo]:
-    """Detect devices via serial port enumeration."""
-    devices = []
-    
+def _enumerate_ports() -> list[tuple]:
+    """One serial enumeration pass -> (port, vid, pid, serial) tuples."""
     try:
         import serial.tools.list_ports
     except ImportError:
-        return devices
-    
-    for port in serial.tools.list_ports.comports():
-        vid_pid = (port.vid, port.pid) if port.vid and port.pid else None
-        
-        if vid_pid and vid_pid in KNOWN_USB_DEVICES:
-            name, device_type, caps = KNOWN_USB_DEVICES[vid_pid]
-            
-            devices.append(DeviceInfo(
+        return []
+
+    return [
+        (port.device, port.vid, port.pid, port.serial_number)
+        for port in serial.tools.list_ports.comports()
+    ]
+
+
+def _classify_known(entries: list[tuple]) -> tuple[list[DeviceInfo], list[DeviceInfo]]:
+    """Classify enumerated ports against KNOWN_USB_DEVICES.
+
+    Pure dict lookups on (vid, pid); no serial port is opened here, so
+    the common all-devices-known case costs a single enumeration pass.
+    Returns (known_devices, unknown_devices).
+    """
+    known = []
+    unknown = []
+
+    for port, vid, pid, serial_number in entries:
+        if not (vid and pid):
+            continue
+
+        entry = KNOWN_USB_DEVICES.get((vid, pid))
+        if entry:
+            name, device_type, caps = entry
+            known.append(DeviceInfo(
                 name=name,
                 device_type=device_type,
-                port=port.device,
-                vid=port.vid,
-                pid=port.pid,
-                serial=port.serial_number,
-                capabilities=caps.copy(),
+                port=port,
+                vid=vid,
+                pid=pid,
+                serial=serial_number,
+                capabilities=caps,
             ))
-        elif port.vid and port.pid:
+        else:
             # Unknown device with USB IDs - log for potential addition
-            devices.append(DeviceInfo(
-                name=f"Unknown ({port.vid:04x}:{port.pid:04x})",
+            unknown.append(DeviceInfo(
+                name=f"Unknown ({vid:04x}:{pid:04x})",
                 device_type="unknown",
-                port=port.device,
-                vid=port.vid,
-                pid=port.pid,
-                serial=port.serial_number,
-                capabilities=[],
+                port=port,
+                vid=vid,
+                pid=pid,
+                serial=serial_number,
+                capabilities=(),
             ))
-    
-    return devices
+
+    return known, unknown
+
+
+def _detect_serial_devices() -> list[DeviceInfo]:
+    """Detect devices via serial port enumeration."""
+    known, unknown = _classify_known(_enumerate_ports())
+    return known + unknown
 
 
 def _identify_rp2040_device(device: DeviceInfo) -> DeviceInfo:
@@ -174,11 +232,11 @@ def _identify_rp2040_device(device: DeviceInfo) -> DeviceInfo:
             if "bolt" in response.lower() or "curious" in response.lower():
                 device.name = "Curious Bolt"
                 device.device_type = "bolt"
-                device.capabilities = ["glitch", "logic", "dpa"]
+                device.capabilities = ("glitch", "logic", "dpa")
             elif "faulty" in response.lower() or "emfi" in response.lower():
                 device.name = "FaultyCat"
                 device.device_type = "faultycat"
-                device.capabilities = ["emfi", "glitch", "jtag_scan"]
+                device.capabilities = ("emfi", "glitch", "jtag_scan")
                 
     except Exception:
         pass  # Can't identify, leave as unknown
@@ -186,28 +244,40 @@ def _identify_rp2040_device(device: DeviceInfo) -> DeviceInfo:
     return device
 
 
+def _merge_into(existing: DeviceInfo, dev: DeviceInfo):
+    """Fill gaps in existing from a duplicate sighting of the same device."""
+    if dev.port and not existing.port:
+        existing.port = dev.port
+    if dev.usb_path and not existing.usb_path:
+        existing.usb_path = dev.usb_path
+    if dev.serial and not existing.serial:
+        existing.serial = dev.serial
+    if dev.capabilities and not existing.capabilities:
+        existing.capabilities = dev.capabilities
+
+
 def _deduplicate_devices(devices: list[DeviceInfo]) -> list[DeviceInfo]:
-    """Remove duplicate device entries (USB + serial showing same device)."""
-    seen = {}
-    
+    """Remove duplicate device entries (USB + serial showing same device).
+
+    Single-pass hash merge: one dict probe per input, keyed on the serial
+    number when the device reports one and on VID:PID plus physical path
+    otherwise.
+    """
+    merged = {}
+
     for dev in devices:
-        # Key by serial number if available, otherwise by VID:PID:type
         if dev.serial:
-            key = (dev.serial, dev.device_type)
+            key = (dev.serial, dev.vid, dev.pid)
         else:
-            key = (dev.vid, dev.pid, dev.device_type, dev.port or dev.usb_path)
-        
-        if key not in seen:
-            seen[key] = dev
+            key = (dev.vid, dev.pid, dev.usb_path or dev.port)
+
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = dev
         else:
-            # Merge - prefer entry with serial port
-            existing = seen[key]
-            if dev.port and not existing.port:
-                existing.port = dev.port
-            if dev.usb_path and not existing.usb_path:
-                existing.usb_path = dev.usb_path
-    
-    return list(seen.values())
+            _merge_into(existing, dev)
+
+    return list(merged.values())
 
 
 # --------------------------------------------------------------------------
@@ -234,9 +304,12 @@ def detect(identify_unknown: bool = True) -> dict[str, DeviceInfo]:
     # Deduplicate
     devices = _deduplicate_devices(devices)
     
-    # Identify unknown RP2040 devices
+    # Actively probe only devices the VID:PID tables could not settle;
+    # everything classified above never has its serial port opened
     if identify_unknown:
-        devices = [_identify_rp2040_device(d) for d in devices]
+        for dev in devices:
+            if dev.device_type == "rp2040_unknown":
+                _identify_rp2040_device(dev)
     
     # Filter out unknown devices for the return dict
     known_devices = [d for d in devices if d.device_type != "unknown"]
@@ -260,6 +333,69 @@ def detect(identify_unknown: bool = True) -> dict[str, DeviceInfo]:
     return result
 
 
+# Short-TTL detection cache: full detect() probes USB and may open serial
+# ports, which costs hundreds of ms per call
+_detect_cache = {"ts": 0.0, "ports": None, "devices": None}
+
+
+def _port_snapshot():
+    """Cheap (vid, pid, device) fingerprint of the current serial ports."""
+    try:
+        import serial.tools.list_ports
+    except ImportError:
+        return None
+    return frozenset(
+        (port.vid, port.pid, port.device)
+        for port in serial.tools.list_ports.comports()
+    )
+
+
+def cached_detect(max_age: float = 2.0, refresh: bool = False) -> dict[str, DeviceInfo]:
+    """
+    detect(), memoized for a short window.
+
+    Returns the previous result if it is younger than max_age seconds and
+    the set of serial ports has not changed; pass refresh=True to force a
+    rescan (e.g. a user-driven "rescan" action).
+    """
+    import time
+
+    now = time.monotonic()
+    if (not refresh
+            and _detect_cache["devices"] is not None
+            and now - _detect_cache["ts"] < max_age
+            and _port_snapshot() == _detect_cache["ports"]):
+        return _detect_cache["devices"]
+
+    devices = detect()
+    _detect_cache["ts"] = time.monotonic()
+    _detect_cache["ports"] = _port_snapshot()
+    _detect_cache["devices"] = devices
+    return devices
+
+
+def index_by_capability(devices: Optional[dict[str, DeviceInfo]] = None) -> dict[str, DeviceInfo]:
+    """
+    Map each capability string to the first device offering it.
+
+    One pass over the device dict replaces the per-command linear scans
+    for a capable device; the index is cached alongside the detect cache
+    and rebuilt only when the underlying device dict changes.
+    """
+    if devices is None:
+        devices = cached_detect()
+
+    if _detect_cache.get("index_source") is not devices:
+        index = {}
+        for dev in devices.values():
+            for cap in dev.capabilities:
+                index.setdefault(cap, dev)
+        _detect_cache["index"] = index
+        _detect_cache["index_source"] = devices
+
+    return _detect_cache["index"]
+
+
 def list_devices(include_unknown: bool = False) -> list[DeviceInfo]:
     """
     List all detected devices.
@@ -290,24 +426,29 @@ def print_detected_devices():
     devices = list_devices(include_unknown=True)
     
     if not devices:
-        print("No devices detected.")
-        print("\nTroubleshooting:")
-        print("  - Check USB connections")
-        print("  - Ensure drivers are installed")
-        print("  - Try: pip install pyusb pyserial")
+        print("No devices detected.\n"
+              "\nTroubleshooting:\n"
+              "  - Check USB connections\n"
+              "  - Ensure drivers are installed\n"
+              "  - Try: pip install pyusb pyserial")
         return
-    
-    print(f"{'Name':<25} {'Type':<15} {'Port':<20} {'VID:PID':<12} {'Capabilities'}")
-    print("-" * 90)
-    
+
+    # Build the whole table, then emit it with a single print
+    lines = [
+        f"{'Name':<25} {'Type':<15} {'Port':<20} {'VID:PID':<12} {'Capabilities'}",
+        "-" * 90,
+    ]
+
     for dev in devices:
         vid_pid = f"{dev.vid:04x}:{dev.pid:04x}" if dev.vid and dev.pid else "N/A"
         port = dev.port or "N/A"
         caps = ", ".join(dev.capabilities[:3]) if dev.capabilities else "N/A"
         if len(dev.capabilities) > 3:
             caps += "..."
-        
-        print(f"{dev.name:<25} {dev.device_type:<15} {port:<20} {vid_pid:<12} {caps}")
+
+        lines.append(f"{dev.name:<25} {dev.device_type:<15} {port:<20} {vid_pid:<12} {caps}")
+
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -1,8 +1,10 @@
 from cobs import cobs
+from dataclasses import dataclass, fields
 import serial
-import time 
+import time
 import os
 import sys
+from collections import deque
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -24,8 +26,82 @@ import tooling.bpio.StatusRequestTypes as StatusRequestTypes
 import tooling.bpio.StatusResponse as StatusResponse
 #import tooling.bpio.ErrorResponse as ErrorResponse
 
+# The cobs package falls back to a pure-Python codec when its C extension
+# failed to build; that is ~50x slower and shows up on multi-KB flash reads
+_COBS_ACCELERATED = '_cobs_ext' in getattr(cobs.encode, '__module__', '')
+if not _COBS_ACCELERATED:
+    print("Warning: pure-Python COBS codec in use (cobs C extension not built); "
+          "large transfers will be slow. Reinstall with: pip install --force-reinstall cobs")
+
+
+def request_low_latency(ser):
+    """Ask the kernel to minimize the USB-serial latency timer for a port.
+
+    Linux FTDI/usb-serial drivers default to a 16 ms latency timer, which
+    dominates every small request/response round-trip regardless of baud.
+    CDC-ACM ports and non-Linux platforms have no such knob; every step here
+    fails silently so this is safe to call on any open serial.Serial.
+    """
+    try:
+        # pyserial >= 3.5; only implemented for FTDI-style drivers
+        ser.set_low_latency_mode(True)
+    except (AttributeError, NotImplementedError, ValueError, OSError):
+        pass
+    if sys.platform.startswith('linux') and ser.port:
+        tty = os.path.basename(ser.port)
+        try:
+            with open(f'/sys/bus/usb-serial/devices/{tty}/latency_timer', 'w') as f:
+                f.write('1')
+        except OSError:
+            pass
+
+
+@dataclass(slots=True)
+class ParsedStatus:
+    """Parsed StatusResponse fields.
+
+    A slots instance is smaller and cheaper to build than the equivalent
+    dict, and attribute access skips hashing; as_dict() serves callers
+    that still expect the historical dictionary shape.
+    """
+    error: str | None = None
+    version_flatbuffers_major: int = 0
+    version_flatbuffers_minor: int = 0
+    version_hardware_major: int = 0
+    version_hardware_minor: int = 0
+    version_firmware_major: int = 0
+    version_firmware_minor: int = 0
+    version_firmware_git_hash: str = ''
+    version_firmware_date: str = ''
+    modes_available: list = None
+    mode_current: str | None = None
+    mode_pin_labels: list = None
+    mode_bitorder_msb: bool = False
+    mode_max_packet_size: int = 0
+    mode_max_write: int = 0
+    mode_max_read: int = 0
+    psu_enabled: bool = False
+    psu_set_mv: int = 0
+    psu_set_ma: int = 0
+    psu_measured_mv: int = 0
+    psu_measured_ma: int = 0
+    psu_current_error: bool = False
+    pullup_enabled: bool = False
+    adc_mv: list = None
+    io_direction: int = 0
+    io_value: int = 0
+    disk_size_mb: int = 0
+    disk_used_mb: int = 0
+    led_count: int = 0
+
+    def as_dict(self):
+        """Flat dict matching the shape status_request has always returned"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
 class BPIOClient:
-    def __init__(self, port, baudrate=3000000, timeout=2, debug=False, minimum_version=0):
+    def __init__(self, port, baudrate=3000000, timeout=2, debug=False, minimum_version=0,
+                 transport=None):
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
@@ -33,10 +109,31 @@ class BPIOClient:
         self.serial_port = None
         self.version_flatbuffers_major = 2
         self.minimum_version_flatbuffers_minor = minimum_version
+        # Receive carry buffer: holds bytes read past a frame delimiter so they
+        # are not lost between calls
+        self._rxbuf = bytearray()
+        # Cached DataRequest frame templates keyed by request shape; hot loops
+        # patch the write payload in place instead of rebuilding the frame
+        self._data_request_templates = {}
+        # Cached serialized StatusRequest frames keyed by query tuple
+        self._status_request_frames = {}
+        # Reusable transmit buffer for framed packets
+        self._txbuf = bytearray(1024)
+        # One builder reused for every request; requests are issued serially,
+        # so Clear() between messages is safe and avoids re-allocating the
+        # builder's backing bytearray per message
+        self._builder = flatbuffers.Builder(1024)
         
-        # Open serial port
+        # Open the transport: an explicitly injected one wins, otherwise
+        # open_transport honours HWH_RECORD/HWH_REPLAY before falling
+        # back to a plain serial.Serial
         try:
-            self.serial_port = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
+            if transport is None:
+                from ..backends._mock_serial import open_transport
+                transport = open_transport(self.port, self.baudrate,
+                                           timeout=self.timeout)
+            self.serial_port = transport
+            request_low_latency(self.serial_port)
             if self.debug:
                 print(f"Opened serial port {self.port} at {self.baudrate} baud")
         except serial.SerialException as e:
@@ -66,68 +163,83 @@ class BPIOClient:
         """Destructor - ensure port is closed"""
         self.close()
         
+    def _receive_frame(self):
+        """Read one COBS frame (everything up to the 0x00 delimiter) in bulk chunks.
+
+        Bytes received past the delimiter stay in self._rxbuf for the next call,
+        so pipelined responses are not lost. Returns the frame without the
+        delimiter, or None on timeout."""
+        timeout_start = time.time()
+
+        while True:
+            # Check the carry buffer first - a complete frame may already be here
+            delimiter_pos = self._rxbuf.find(b'\x00')
+            if delimiter_pos != -1:
+                frame = bytes(self._rxbuf[:delimiter_pos])
+                del self._rxbuf[:delimiter_pos + 1]
+                return frame
+
+            # Pull a bulk chunk; read_until blocks until delimiter, size limit,
+            # or the serial timeout - no per-byte read() round-trips
+            chunk = self.serial_port.read_until(b'\x00', size=4096)
+            if chunk:
+                self._rxbuf.extend(chunk)
+            elif time.time() - timeout_start > self.timeout:
+                print("Timeout waiting for response")
+                return None
+
+    def _submit(self, data):
+        """Write one COBS-framed request without waiting for the response"""
+        # Assemble the framed packet in a persistent buffer; cobs has no
+        # encode-into API, but this avoids allocating the encoded+delimiter
+        # concatenation on every request
+        txbuf = self._txbuf
+        txbuf.clear()
+        txbuf += cobs.encode(data)
+        txbuf.append(0)
+        self.serial_port.write(txbuf)
+
+        if self.debug:
+            print(f"Sent {len(data)} bytes (original data)")
+            print(f"Total bytes sent: {len(txbuf)} (COBS + delimiter)")
+
+    def _reap(self):
+        """Read and COBS-decode one response frame"""
+        resp_encoded = self._receive_frame()
+        if resp_encoded is None:
+            return None
+
+        if len(resp_encoded) == 0:
+            print("No response data received")
+            return None
+
+        if self.debug:
+            print(f"Received {len(resp_encoded)} bytes (COBS encoded)")
+
+        # COBS decode the response
+        try:
+            resp_data = cobs.decode(resp_encoded)
+            if self.debug:
+                print(f"Decoded {len(resp_data)} bytes")
+            return resp_data
+        except cobs.DecodeError as e:
+            print(f"COBS decode error: {e}")
+            return None
+
     def send_and_receive(self, data):
         """Send COBS-encoded data to serial port and receive COBS-encoded response"""
         if not self.serial_port or not self.serial_port.is_open:
             print("Serial port is not open")
             return None
-            
-        try:           
+
+        try:
             # Clear any pending data
             self.serial_port.reset_input_buffer()
             self.serial_port.reset_output_buffer()
-            
-            # Send COBS-encoded data followed by delimiter (0x00)
-            packet = cobs.encode(data) + b'\x00'
-            self.serial_port.write(packet)
-            
-            if self.debug:
-                print(f"Sent {len(data)} bytes (original data)")
-                print(f"Total bytes sent: {len(packet) + 1} (COBS + delimiter)")
-
-            # Read response until we get the delimiter (0x00) - most efficient
-            resp_encoded = bytearray()
-            timeout_start = time.time()
-
-            while True:
-                # Read all available data at once
-                available = self.serial_port.in_waiting
-                if available > 0:
-                    chunk = self.serial_port.read(available)
-                    resp_encoded.extend(chunk)
-                    
-                    # Check if we have the complete message (contains delimiter)
-                    delimiter_pos = resp_encoded.find(b'\x00')
-                    if delimiter_pos != -1:
-                        # Found delimiter, truncate at delimiter position
-                        resp_encoded = resp_encoded[:delimiter_pos]
-                        break
-                else:
-                    # No data available, check timeout
-                    if time.time() - timeout_start > self.timeout:
-                        print("Timeout waiting for response")
-                        return None
-                    time.sleep(0.001)  # Small delay to prevent busy waiting
-
-            # Convert back to bytes
-            resp_encoded = bytes(resp_encoded)
-            
-            if len(resp_encoded) == 0:
-                print("No response data received")
-                return None
-                
-            if self.debug:
-                print(f"Received {len(resp_encoded)} bytes (COBS encoded)")
-            
-            # COBS decode the response
-            try:
-                resp_data = cobs.decode(resp_encoded)
-                if self.debug:
-                    print(f"Decoded {len(resp_data)} bytes")
-                return resp_data
-            except cobs.DecodeError as e:
-                print(f"COBS decode error: {e}")
-                return None
+            self._rxbuf.clear()
+
+            self._submit(data)
+            return self._reap()
 
         except serial.SerialException as e:
             print(f"Serial communication error: {e}")
@@ -135,6 +247,11 @@ class BPIOClient:
             print(f"Error: {e}")
         return None
     
+    def _fresh_builder(self):
+        """Get the shared FlatBuffers builder, cleared for a new message"""
+        self._builder.Clear()
+        return self._builder
+
     def _expected_response(self, request_type):
         """Get the expected response type for a given request type"""
         if request_type == RequestPacketContents.RequestPacketContents.ConfigurationRequest:
@@ -146,9 +263,8 @@ class BPIOClient:
         else:
             return None
 
-    def send_request(self, builder, request_contents_type, request_contents):
-        """Send a request packet and return the response"""
-        """Wrap contents in a RequestPacket"""
+    def _build_request(self, builder, request_contents_type, request_contents):
+        """Wrap contents in a RequestPacket and return the serialized bytes"""
         RequestPacket.Start(builder)
         RequestPacket.AddVersionMajor(builder, self.version_flatbuffers_major)  # BPIO2
         RequestPacket.AddMinimumVersionMinor(builder, self.minimum_version_flatbuffers_minor) # Minimum flatbuffers version required
@@ -156,35 +272,42 @@ class BPIOClient:
         RequestPacket.AddContents(builder, request_contents)
         final_packet = RequestPacket.End(builder)
         builder.Finish(final_packet)
-        data = builder.Output()
-    
-        resp_data = self.send_and_receive(data)
-
-        if not resp_data:
-            return False
+        return builder.Output()
 
-        # Decode response packet
-        resp_packet = ResponsePacket.ResponsePacket.GetRootAsResponsePacket(resp_data, 0)     
+    def _parse_response(self, resp_data, request_contents_type):
+        """Decode a ResponsePacket and check it matches the request type"""
+        resp_packet = ResponsePacket.ResponsePacket.GetRootAsResponsePacket(resp_data, 0)
 
         # Check for ErrorResponse
         if resp_packet.Error():
             print(f"Error: {resp_packet.Error().decode('utf-8')}")
             return False
-        
+
         response_contents_type = resp_packet.ContentsType()
         if self.debug:
-            print(f"ContentsType: {response_contents_type}")          
-        
-        expected_type = self._expected_response(request_contents_type)        
+            print(f"ContentsType: {response_contents_type}")
+
+        expected_type = self._expected_response(request_contents_type)
         if response_contents_type != expected_type:
             print(f"Unexpected response type: {response_contents_type}")
             return False
 
         return resp_packet
+
+    def send_request(self, builder, request_contents_type, request_contents):
+        """Send a request packet and return the response"""
+        data = self._build_request(builder, request_contents_type, request_contents)
+
+        resp_data = self.send_and_receive(data)
+
+        if not resp_data:
+            return False
+
+        return self._parse_response(resp_data, request_contents_type)
     
     def configuration_request(self, **kwargs):
         """Create a BPIO ConfigurationRequest packet"""
-        builder = flatbuffers.Builder(1024)
+        builder = self._fresh_builder()
 
         mode_string = None
         if 'mode' in kwargs:
@@ -295,63 +418,122 @@ class BPIOClient:
         
         return True
 
-    def status_request(self, **kwargs):
-        """Create a BPIO StatusRequest packet"""
-        builder = flatbuffers.Builder(1024)
-
-        # Create the query vector BEFORE starting the StatusRequest table
-        StatusRequest.StartQueryVector(builder, 1)
-        builder.PrependUint8(StatusRequestTypes.StatusRequestTypes.All)
-        #builder.PrependUint8(StatusRequestTypes.StatusRequestTypes.Version)
-        query_vector = builder.EndVector()
-
-        # Create a StatusRequest
-        StatusRequest.Start(builder)
-        StatusRequest.AddQuery(builder, query_vector)
-        status_request = StatusRequest.End(builder)
-        resp_packet = self.send_request(builder, RequestPacketContents.RequestPacketContents.StatusRequest, status_request)
-        
+    def _status_request_frame(self, query):
+        """Serialized StatusRequest packet for a query tuple, built once.
+
+        A StatusRequest has no variable payload, so the finished frame is a
+        constant per query shape; caching it keeps the interpreted
+        FlatBuffers builder entirely out of status polling loops.
+        """
+        frame = self._status_request_frames.get(query)
+        if frame is None:
+            builder = self._fresh_builder()
+
+            # Create the query vector BEFORE starting the StatusRequest table
+            StatusRequest.StartQueryVector(builder, len(query))
+            for query_type in reversed(query):
+                builder.PrependUint8(query_type)
+            query_vector = builder.EndVector()
+
+            StatusRequest.Start(builder)
+            StatusRequest.AddQuery(builder, query_vector)
+            status_request = StatusRequest.End(builder)
+            frame = bytes(self._build_request(builder, RequestPacketContents.RequestPacketContents.StatusRequest, status_request))
+            self._status_request_frames[query] = frame
+        return frame
+
+    # Keyword flags accepted by status_request mapped to the query enum, so
+    # call sites can ask for exactly the field groups they need
+    _STATUS_QUERY_FLAGS = {
+        'version': StatusRequestTypes.StatusRequestTypes.Version,
+        'mode': StatusRequestTypes.StatusRequestTypes.Mode,
+        'pullup': StatusRequestTypes.StatusRequestTypes.Pullup,
+        'psu': StatusRequestTypes.StatusRequestTypes.PSU,
+        'adc': StatusRequestTypes.StatusRequestTypes.ADC,
+        'io': StatusRequestTypes.StatusRequestTypes.IO,
+        'disk': StatusRequestTypes.StatusRequestTypes.Disk,
+        'led': StatusRequestTypes.StatusRequestTypes.LED,
+    }
+
+    def status_request(self, query=None, as_dict=True, **kwargs):
+        """Create a BPIO StatusRequest packet
+
+        query is an optional iterable of StatusRequestTypes members.
+        Alternatively pass field-group flags (version=True, mode=True,
+        psu=True, ...) to request just those groups; with neither, the
+        device serializes everything.
+
+        With as_dict=False, returns the ParsedStatus slots object instead
+        of a dict — no per-poll key allocation for monitoring loops."""
+        if query is None:
+            query = tuple(qtype for flag, qtype in self._STATUS_QUERY_FLAGS.items() if kwargs.get(flag))
+            if not query:
+                query = (StatusRequestTypes.StatusRequestTypes.All,)
+        data = self._status_request_frame(tuple(query))
+        resp_data = self.send_and_receive(data)
+        if not resp_data:
+            return None
+
+        resp_packet = self._parse_response(resp_data, RequestPacketContents.RequestPacketContents.StatusRequest)
         if not resp_packet:
             return None
             
         status_resp = StatusResponse.StatusResponse()
         status_resp.Init(resp_packet.Contents().Bytes, resp_packet.Contents().Pos)
 
-        # copy the status response into a dictionary
-        status_dict = {
-            'error': status_resp.Error().decode('utf-8') if status_resp.Error() else None,
-            'version_flatbuffers_major': status_resp.VersionFlatbuffersMajor(),
-            'version_flatbuffers_minor': status_resp.VersionFlatbuffersMinor(),
-            'version_hardware_major': status_resp.VersionHardwareMajor(),
-            'version_hardware_minor': status_resp.VersionHardwareMinor(),
-            'version_firmware_major': status_resp.VersionFirmwareMajor(),
-            'version_firmware_minor': status_resp.VersionFirmwareMinor(),
-            'version_firmware_git_hash': status_resp.VersionFirmwareGitHash().decode('utf-8'),
-            'version_firmware_date': status_resp.VersionFirmwareDate().decode('utf-8'),
-            'modes_available': [status_resp.ModesAvailable(i).decode('utf-8') for i in range(status_resp.ModesAvailableLength())],
-            'mode_current': status_resp.ModeCurrent().decode('utf-8') if status_resp.ModeCurrent() else None,
-            'mode_pin_labels': [status_resp.ModePinLabels(i).decode('utf-8') for i in range(status_resp.ModePinLabelsLength())],
-            'mode_bitorder_msb': status_resp.ModeBitorderMsb(),
-            'mode_max_packet_size': status_resp.ModeMaxPacketSize(),
-            'mode_max_write': status_resp.ModeMaxWrite(),
-            'mode_max_read': status_resp.ModeMaxRead(),
-            'psu_enabled': status_resp.PsuEnabled(),
-            'psu_set_mv': status_resp.PsuSetMv(),
-            'psu_set_ma': status_resp.PsuSetMa(),
-            'psu_measured_mv': status_resp.PsuMeasuredMv(),
-            'psu_measured_ma': status_resp.PsuMeasuredMa(),
-            'psu_current_error': status_resp.PsuCurrentError(),
-            'pullup_enabled': status_resp.PullupEnabled(),
-            'adc_mv': [status_resp.AdcMv(i) for i in range(status_resp.AdcMvLength())],
-            'io_direction': status_resp.IoDirection(),
-            'io_value': status_resp.IoValue(),
-            'disk_size_mb': status_resp.DiskSizeMb(),
-            'disk_used_mb': status_resp.DiskUsedMb(),
-            'led_count': status_resp.LedCount()
-        }
-
-        return status_dict
-    
+        parsed = self._parse_status_response(status_resp)
+        if not as_dict:
+            return parsed
+        return parsed.as_dict()
+
+    def _parse_status_response(self, status_resp):
+        """Copy a StatusResponse table into a ParsedStatus"""
+        return ParsedStatus(
+            error=status_resp.Error().decode('ascii') if status_resp.Error() else None,
+            version_flatbuffers_major=status_resp.VersionFlatbuffersMajor(),
+            version_flatbuffers_minor=status_resp.VersionFlatbuffersMinor(),
+            version_hardware_major=status_resp.VersionHardwareMajor(),
+            version_hardware_minor=status_resp.VersionHardwareMinor(),
+            version_firmware_major=status_resp.VersionFirmwareMajor(),
+            version_firmware_minor=status_resp.VersionFirmwareMinor(),
+            version_firmware_git_hash=status_resp.VersionFirmwareGitHash().decode('ascii') if status_resp.VersionFirmwareGitHash() else '',
+            version_firmware_date=status_resp.VersionFirmwareDate().decode('ascii') if status_resp.VersionFirmwareDate() else '',
+            modes_available=[status_resp.ModesAvailable(i).decode('ascii') for i in range(status_resp.ModesAvailableLength())],
+            mode_current=status_resp.ModeCurrent().decode('ascii') if status_resp.ModeCurrent() else None,
+            mode_pin_labels=[status_resp.ModePinLabels(i).decode('ascii') for i in range(status_resp.ModePinLabelsLength())],
+            mode_bitorder_msb=status_resp.ModeBitorderMsb(),
+            mode_max_packet_size=status_resp.ModeMaxPacketSize(),
+            mode_max_write=status_resp.ModeMaxWrite(),
+            mode_max_read=status_resp.ModeMaxRead(),
+            psu_enabled=status_resp.PsuEnabled(),
+            psu_set_mv=status_resp.PsuSetMv(),
+            psu_set_ma=status_resp.PsuSetMa(),
+            psu_measured_mv=status_resp.PsuMeasuredMv(),
+            psu_measured_ma=status_resp.PsuMeasuredMa(),
+            psu_current_error=status_resp.PsuCurrentError(),
+            pullup_enabled=status_resp.PullupEnabled(),
+            # Bulk vector read - AdcMv(i) per element pays offset math and
+            # bounds checks in Python for each entry
+            adc_mv=status_resp.AdcMvAsNumpy().tolist() if status_resp.AdcMvLength() else [],
+            io_direction=status_resp.IoDirection(),
+            io_value=status_resp.IoValue(),
+            disk_size_mb=status_resp.DiskSizeMb(),
+            disk_used_mb=status_resp.DiskUsedMb(),
+            led_count=status_resp.LedCount(),
+        )
+
+    def status_version_only(self):
+        """Status filtered to just the version fields"""
+        return self.status_request(query=(StatusRequestTypes.StatusRequestTypes.Version,))
+
+    def status_mode_only(self):
+        """Status filtered to just the mode fields"""
+        return self.status_request(query=(StatusRequestTypes.StatusRequestTypes.Mode,))
+
+    def status_psu_only(self):
+        """Status filtered to just the PSU fields"""
+        return self.status_request(query=(StatusRequestTypes.StatusRequestTypes.PSU,))
+
     def print_status_response(self, status_dict):
         """Parse and display status response from dictionary"""
         print("StatusResponse:")
@@ -424,9 +606,9 @@ class BPIOClient:
         else:
             print("Failed to get status information.")
 
-    def data_request(self, start_main=False, start_alt=False, data_write=None, bytes_read=0, stop_main=False, stop_alt=False):
-        """Create a BPIO DataRequest packet"""
-        builder = flatbuffers.Builder(1024)
+    def _build_data_request(self, start_main=False, start_alt=False, data_write=None, bytes_read=0, stop_main=False, stop_alt=False):
+        """Build one serialized DataRequest packet"""
+        builder = self._fresh_builder()
 
         data_write_vector = None
         if data_write and len(data_write) > 0:
@@ -448,24 +630,134 @@ class BPIOClient:
             DataRequest.AddStopAlt(builder, True)
 
         data_request = DataRequest.End(builder)
-        resp_packet = self.send_request(builder, RequestPacketContents.RequestPacketContents.DataRequest, data_request)
-        
+        return self._build_request(builder, RequestPacketContents.RequestPacketContents.DataRequest, data_request)
+
+    def _parse_data_response(self, resp_data):
+        """Parse one DataResponse; returns bytes read, None, or False on error"""
+        resp_packet = self._parse_response(resp_data, RequestPacketContents.RequestPacketContents.DataRequest)
+
         if not resp_packet:
             return False
-                    
+
         data_resp = DataResponse.DataResponse()
         data_resp.Init(resp_packet.Contents().Bytes, resp_packet.Contents().Pos)
-        
+
         if data_resp.Error():
             if self.debug: print(f"Data request error: {data_resp.Error().decode('utf-8')}")
             return False
 
-        # Return data read, if any
-        if data_resp.DataReadLength() > 0:
-            data_bytes = data_resp.DataReadAsNumpy()
+        # Return data read, if any. Locate the vector in the response buffer
+        # and slice it through a memoryview - one materializing copy, no
+        # intermediate numpy array per response
+        length = data_resp.DataReadLength()
+        if length > 0:
+            tab = data_resp._tab
+            start = tab.Vector(flatbuffers.number_types.UOffsetTFlags.py_type(tab.Offset(6)))
+            data_bytes = bytes(memoryview(tab.Bytes)[start:start + length])
             if self.debug:  print(f"Data read: {' '.join(f'{b:02x}' for b in data_bytes)}")
-            return data_bytes.tobytes()
+            return data_bytes
         else:
             return None
-            
-        return b''
\ No newline at end of file
+
+    def _data_request_template(self, payload_len, **kwargs):
+        """Get a (frame, payload_offset) template for a DataRequest shape.
+
+        Built once per shape and cached; two probe builds with different
+        filler bytes locate the payload, so repeated requests that differ
+        only in their write payload (I2C scan probes, SPI flash read
+        commands) skip the per-call FlatBuffers build entirely."""
+        key = (payload_len, tuple(sorted(kwargs.items())))
+        cached = self._data_request_templates.get(key)
+        if cached is None:
+            probe_a = self._build_data_request(data_write=b'\xaa' * payload_len, **kwargs)
+            probe_b = self._build_data_request(data_write=b'\x55' * payload_len, **kwargs)
+            # The two frames differ only in the payload bytes
+            offset = next(i for i, (a, b) in enumerate(zip(probe_a, probe_b)) if a != b)
+            cached = (bytearray(probe_a), offset)
+            self._data_request_templates[key] = cached
+        return cached
+
+    def _frame_for(self, kwargs):
+        """Serialize one DataRequest, reusing a cached template when the
+        request carries a write payload.
+
+        An optional 'data_write_header' (command/address bytes) is patched
+        into the frame ahead of 'data_write', so callers never have to
+        build a concatenated header+payload object."""
+        header = kwargs.get('data_write_header') or b''
+        data_write = kwargs.get('data_write')
+        if data_write is None:
+            payload = b''
+        elif isinstance(data_write, (bytes, bytearray, memoryview)):
+            payload = data_write
+        else:
+            payload = bytes(data_write)
+
+        total = len(header) + len(payload)
+        if not total:
+            shape = {k: v for k, v in kwargs.items() if k not in ('data_write', 'data_write_header')}
+            return self._build_data_request(**shape)
+
+        shape = {k: v for k, v in kwargs.items() if k not in ('data_write', 'data_write_header')}
+        frame, offset = self._data_request_template(total, **shape)
+        if header:
+            frame[offset:offset + len(header)] = header
+        if payload:
+            frame[offset + len(header):offset + total] = payload
+        return frame
+
+    def data_request(self, **kwargs):
+        """Create a BPIO DataRequest packet"""
+        data = self._frame_for(kwargs)
+
+        resp_data = self.send_and_receive(data)
+
+        if not resp_data:
+            return False
+
+        return self._parse_data_response(resp_data)
+
+    def data_request_batch(self, requests, window=16):
+        """Pipeline multiple DataRequest packets over the serial port.
+
+        Submits up to `window` requests back-to-back before reaping the first
+        response, amortizing USB round-trip latency across the batch. Each
+        entry in `requests` is a kwargs dict for data_request(). Returns a
+        list of results in request order."""
+        if not self.serial_port or not self.serial_port.is_open:
+            print("Serial port is not open")
+            return [False] * len(requests)
+
+        results = []
+        outstanding = deque()
+
+        try:
+            # Clear any pending data
+            self.serial_port.reset_input_buffer()
+            self.serial_port.reset_output_buffer()
+            self._rxbuf.clear()
+
+            for kwargs in requests:
+                self._submit(self._frame_for(kwargs))
+                outstanding.append(kwargs)
+
+                if len(outstanding) >= window:
+                    outstanding.popleft()
+                    resp_data = self._reap()
+                    results.append(self._parse_data_response(resp_data) if resp_data else False)
+
+            while outstanding:
+                outstanding.popleft()
+                resp_data = self._reap()
+                results.append(self._parse_data_response(resp_data) if resp_data else False)
+
+        except serial.SerialException as e:
+            print(f"Serial communication error: {e}")
+        except Exception as e:
+            print(f"Error: {e}")
+
+        # Pad with failures if the batch aborted early
+        while len(results) < len(requests):
+            results.append(False)
+
+        return results
\ No newline at end of file
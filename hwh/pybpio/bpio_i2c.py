@@ -55,42 +55,48 @@ class BPIOI2C(BPIOBase):
             bytes_read=num_bytes,
         )   
     
-    def transfer(self, write_data=None, read_bytes=0):
-        """Perform an I2C transaction"""
+    def transfer(self, write_data=None, read_bytes=0, write_header=None):
+        """Perform an I2C transaction
+
+        write_header carries the address/command bytes separately from the
+        payload so large writes are not copied into a joined buffer."""
         if not self.config_check():
             return None
-            
+
         return self.client.data_request(
             start_main=True,
+            data_write_header=write_header,
             data_write=write_data,
             bytes_read=read_bytes,
             stop_main=True
         )
     
+    # Outstanding probe cap, sized to the firmware's inbound frame queue
+    SCAN_INFLIGHT = 16
+
     def scan(self, start_addr=0x00, end_addr=0x7F):
         """Scan for I2C devices"""
         if not self.config_check():
             return []
             
-        found_devices = []
         print(f"Scanning I2C bus from 0x{start_addr:02X} to 0x{end_addr:02X}...")
-        
+
+        # Pipeline every probe through one batched submission instead of a
+        # synchronous USB round-trip per address
+        requests = []
+        probe_addrs = []
         for addr in range(start_addr, end_addr):
             #for write addresses, start, address, stop
-            result = self.transfer(write_data=[addr << 1], read_bytes=0)
-            if result is not False:
-                found_devices.append(addr<<1)
-                #print(f"Device found at 0x{addr:02X}")
-            #else:
-                #self.stop() #clear bus if write failed
-
+            requests.append({'start_main': True, 'data_write': [addr << 1], 'bytes_read': 0, 'stop_main': True})
+            probe_addrs.append(addr << 1)
             #for read addresses, start, address + 1, read 1 byte to NACK, stop
-            result = self.transfer(write_data=[(addr << 1) | 1], read_bytes=1)
-            if result is not False:
-                found_devices.append(addr<<1|1)
-                #print(f"Device found at 0x{addr:02X} (read)")
-            #else:
-                #self.stop() #clear bus if read failed
+            requests.append({'start_main': True, 'data_write': [(addr << 1) | 1], 'bytes_read': 1, 'stop_main': True})
+            probe_addrs.append(addr << 1 | 1)
+
+        results = self.client.data_request_batch(requests, window=self.SCAN_INFLIGHT)
+
+        found_devices = [probe for probe, result in zip(probe_addrs, results) if result is not False]
+
         self.stop()  # Ensure we stop the bus after scanning
-                
+
         return found_devices
\ No newline at end of file
@@ -5,6 +5,8 @@ class BPIOUART(BPIOBase):
 
     def __init__(self, client):
         super().__init__(client)
+        # Last configuration accepted by the firmware, for short-circuiting
+        self._last_config = None
 
     def configure(self, speed=115200, data_bits=8, parity=False, stop_bits=1,
                   flow_control=False, signal_inversion=False, **kwargs):
@@ -24,21 +26,51 @@ class BPIOUART(BPIOBase):
         # Get existing mode_configuration or create new one
         mode_configuration = kwargs.get('mode_configuration', {})
 
-        # Set UART-specific parameters
-        mode_configuration['speed'] = speed
-        mode_configuration['data_bits'] = data_bits
-        mode_configuration['parity'] = parity
-        mode_configuration['stop_bits'] = stop_bits
-        mode_configuration['flow_control'] = flow_control
-        mode_configuration['signal_inversion'] = signal_inversion
+        # Set UART-specific parameters in one update call
+        mode_configuration.update(
+            speed=speed,
+            data_bits=data_bits,
+            parity=parity,
+            stop_bits=stop_bits,
+            flow_control=flow_control,
+            signal_inversion=signal_inversion,
+        )
 
         # Replace mode_configuration in kwargs
         kwargs['mode_configuration'] = mode_configuration
 
+        # Baud-rate sweeps call configure repeatedly; skip the USB
+        # round-trip when the device already runs this exact configuration
+        if self.configured and kwargs == self._last_config:
+            return True
+
         success = self.client.configuration_request(**kwargs)
         self.configured = success
+        if success:
+            self._last_config = dict(kwargs)
+            self._last_config['mode_configuration'] = dict(mode_configuration)
+            # configured cannot flip until the next configure(); bind the
+            # checked-free fast paths so streaming reads/writes skip
+            # config_check per call
+            self.write = self._fast_write
+            self.read = self._fast_read
+        else:
+            self.__dict__.pop('write', None)
+            self.__dict__.pop('read', None)
         return success
 
+    def _fast_write(self, data):
+        """write() fast path, bound after a successful configure()"""
+        return self.client.data_request(
+            data_write=data,
+        )
+
+    def _fast_read(self, num_bytes):
+        """read() fast path, bound after a successful configure()"""
+        return self.client.data_request(
+            bytes_read=num_bytes,
+        )
+
     def write(self, data):
         """Write data to UART
 
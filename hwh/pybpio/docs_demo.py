@@ -74,13 +74,15 @@ class flatbuffers_docs_demo:
             self.serial_port.reset_input_buffer()
             self.serial_port.reset_output_buffer()
             
-            # Send COBS-encoded data followed by delimiter (0x00)
-            packet = cobs.encode(data) + b'\x00'
+            # Send COBS-encoded data followed by delimiter (0x00); appending
+            # to a bytearray avoids allocating a second concatenated buffer
+            packet = bytearray(cobs.encode(data))
+            packet.append(0)
             self.serial_port.write(packet)
-            
+
             if self.debug:
                 print(f"Sent {len(data)} bytes (original data)")
-                print(f"Total bytes sent: {len(packet) + 1} (COBS + delimiter)")
+                print(f"Total bytes sent: {len(packet)} (COBS + delimiter)")
 
             # Read response until we get the delimiter (0x00) - most efficient
             resp_encoded = bytearray()
@@ -1,9 +1,39 @@
 """Pytest configuration and fixtures."""
 
 import pytest
+from hwh.backends import Backend, register_backend, list_backends
 from hwh.detect import DeviceInfo
 
 
+class MockBackend(Backend):
+    """Minimal backend used to exercise the registry."""
+
+    def __init__(self, device: DeviceInfo):
+        super().__init__(device)
+        self.connect_called = False
+        self.disconnect_called = False
+
+    def connect(self) -> bool:
+        self.connect_called = True
+        self._connected = True
+        return True
+
+    def disconnect(self):
+        self.disconnect_called = True
+        self._connected = False
+
+    def get_info(self) -> dict:
+        return {"mock": True}
+
+
+@pytest.fixture
+def mock_backend():
+    """Register MockBackend as 'mock' for the duration of one test."""
+    register_backend("mock", MockBackend)
+    yield MockBackend
+    list_backends().pop("mock", None)
+
+
 @pytest.fixture
 def mock_stlink_device():
     """Mock ST-Link device for testing."""
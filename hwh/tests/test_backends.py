@@ -10,83 +10,39 @@ from hwh.backends import (
 from hwh.detect import DeviceInfo
 
 
-class MockBackend(Backend):
-    """Mock backend for testing."""
-
-    def __init__(self, device: DeviceInfo):
-        super().__init__(device)
-        self.connect_called = False
-        self.disconnect_called = False
-
-    def connect(self) -> bool:
-        self.connect_called = True
-        self._connected = True
-        return True
-
-    def disconnect(self):
-        self.disconnect_called = True
-        self._connected = False
-
-    def get_info(self) -> dict:
-        return {"mock": True}
-
-
 class TestConfigs:
     """Test configuration dataclasses."""
 
-    def test_spi_config_defaults(self):
-        """Test SPIConfig default values."""
-        config = SPIConfig()
-        assert config.speed_hz == 1_000_000
-        assert config.mode == 0
-        assert config.bits_per_word == 8
-        assert config.cs_active_low is True
-
-    def test_spi_config_custom(self):
-        """Test SPIConfig custom values."""
-        config = SPIConfig(speed_hz=2_000_000, mode=3)
-        assert config.speed_hz == 2_000_000
-        assert config.mode == 3
-
-    def test_i2c_config_defaults(self):
-        """Test I2CConfig default values."""
-        config = I2CConfig()
-        assert config.speed_hz == 400_000
-        assert config.address_bits == 7
-
-    def test_uart_config_defaults(self):
-        """Test UARTConfig default values."""
-        config = UARTConfig()
-        assert config.baudrate == 115200
-        assert config.data_bits == 8
-        assert config.parity == "N"
-        assert config.stop_bits == 1
-
-    def test_glitch_config_defaults(self):
-        """Test GlitchConfig default values."""
-        config = GlitchConfig()
-        assert config.width_ns == 100
-        assert config.offset_ns == 0
-        assert config.repeat == 1
-        assert config.trigger_channel is None
-        assert config.trigger_edge == TriggerEdge.FALLING
+    @pytest.mark.parametrize("config_cls,kwargs,expected", [
+        (SPIConfig, {}, {"speed_hz": 1_000_000, "mode": 0,
+                         "bits_per_word": 8, "cs_active_low": True}),
+        (SPIConfig, {"speed_hz": 2_000_000, "mode": 3},
+         {"speed_hz": 2_000_000, "mode": 3}),
+        (I2CConfig, {}, {"speed_hz": 400_000, "address_bits": 7}),
+        (UARTConfig, {}, {"baudrate": 115200, "data_bits": 8,
+                          "parity": "N", "stop_bits": 1}),
+        (GlitchConfig, {}, {"width_ns": 100, "offset_ns": 0, "repeat": 1,
+                            "trigger_channel": None,
+                            "trigger_edge": TriggerEdge.FALLING}),
+    ])
+    def test_config_values(self, config_cls, kwargs, expected):
+        """Test defaults and overrides of the config dataclasses."""
+        config = config_cls(**kwargs)
+        for attr, value in expected.items():
+            assert getattr(config, attr) == value
 
 
 class TestBackendRegistry:
     """Test backend registration and retrieval."""
 
-    def test_register_backend(self):
+    def test_register_backend(self, mock_backend):
         """Test registering a backend."""
-        register_backend("mock", MockBackend)
-
         backends = list_backends()
         assert "mock" in backends
-        assert backends["mock"] == MockBackend
+        assert backends["mock"] == mock_backend
 
-    def test_get_backend(self):
+    def test_get_backend(self, mock_backend):
         """Test getting a backend instance."""
-        register_backend("mock", MockBackend)
-
         device = DeviceInfo(
             name="Mock Device",
             device_type="mock",
@@ -95,7 +51,7 @@ class TestBackendRegistry:
 
         backend = get_backend(device)
         assert backend is not None
-        assert isinstance(backend, MockBackend)
+        assert isinstance(backend, mock_backend)
         assert backend.device == device
 
     def test_get_backend_unknown_type(self):
@@ -113,10 +69,8 @@ class TestBackendRegistry:
 class TestBackendContextManager:
     """Test backend context manager protocol."""
 
-    def test_context_manager(self):
+    def test_context_manager(self, mock_backend):
         """Test backend as context manager."""
-        register_backend("mock", MockBackend)
-
         device = DeviceInfo(
             name="Mock Device",
             device_type="mock",
@@ -209,3 +163,8 @@ class TestGlitchSweep:
         assert "width_ns" in results[0]
         assert "offset_ns" in results[0]
         assert "attempt" in results[0]
+
+        # Columns are exposed for vectorized analysis
+        assert len(results.width_ns) == 18
+        assert results[0]["width_ns"] == 100
+        assert results[0]["status"] == 1
@@ -26,33 +26,48 @@ conditions = [
 
 baud_rates = [300, 1200, 2400, 4800, 9600, 14400, 19200, 28800, 38400, 57600, 115200, 128000, 256000]
 
+# Rates the common USB-UART bridge chips actually support; set
+# SUPPORTED_BAUDS to one of these (or any custom list) to skip rates the
+# adapter on the other end would mangle anyway
+FTDI_BAUDS = [300, 1200, 2400, 4800, 9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600]
+CP210X_BAUDS = [300, 600, 1200, 2400, 4800, 9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600]
+CH340_BAUDS = [300, 1200, 2400, 4800, 9600, 19200, 38400, 57600, 115200]
+
+SUPPORTED_BAUDS = None
+
+# Precomputed neighbour tables (per rate list) so the button handlers do
+# a dict lookup instead of a list scan (and a ValueError) on every keypress
+_neighbour_cache = {}
+
+def _neighbours(rates):
+    key = tuple(rates)
+    cached = _neighbour_cache.get(key)
+    if cached is None:
+        index = {baud: i for i, baud in enumerate(key)}
+        nxt = tuple(key[(i + 1) % len(key)] for i in range(len(key)))
+        prv = tuple(key[(i - 1) % len(key)] for i in range(len(key)))
+        cached = _neighbour_cache[key] = (index, nxt, prv)
+    return cached
+
+def _active_rates():
+    return functions.get_config_value("supported_bauds") or baud_rates
 
 def uart_up():
+    rates = _active_rates()
+    index_map, nxt, _ = _neighbours(rates)
     current_baud = functions.get_config_value("baud_rate")
-    # Find the index of the current baud rate
-    try:
-        index = baud_rates.index(current_baud)
-    except ValueError:
-        # If current baud rate is not in the list, start from the lowest
-        index = -1
-    
-    # Get the next higher baud rate (wrapping around if at the end)
-    new_index = (index + 1) % len(baud_rates)
-    new_baud = baud_rates[new_index]
+    index = index_map.get(current_baud)
+    # Next higher rate (wrapping around); unknown rates start from the lowest
+    new_baud = nxt[index] if index is not None else rates[0]
     functions.change_baudrate(new_baud)
     functions.add_text(f"\n[Rate Up] {new_baud}")
 
 def uart_down():
+    rates = _active_rates()
+    index_map, _, prv = _neighbours(rates)
     current_baud = functions.get_config_value("baud_rate")
-    # Find the index of the current baud rate
-    try:
-        index = baud_rates.index(current_baud)
-    except ValueError:
-        # If current baud rate is not in the list, start from the highest
-        index = len(baud_rates)
-    
-    # Get the next lower baud rate (wrapping around if at the start)
-    new_index = (index - 1) % len(baud_rates)
-    new_baud = baud_rates[new_index]
+    index = index_map.get(current_baud)
+    # Next lower rate (wrapping around); unknown rates start from the highest
+    new_baud = prv[index] if index is not None else rates[-1]
     functions.change_baudrate(new_baud)
     functions.add_text(f"\n[Rate Down] {new_baud}")
\ No newline at end of file
@@ -1,7 +1,10 @@
 ######
 # LEAVE THESE IMPORTS!
 ######
+import struct
 import time
+import zlib
+
 import functions
 
 from pyocd.core.helpers import ConnectHelper
@@ -18,6 +21,10 @@ LENGTH = 50
 REPEAT = 1
 DELAY = 1
 
+# Re-read the shellcode after programming; FileProgrammer already
+# verifies what it wrote, so this double check can be turned off
+VERIFY = True
+
 ###
 # name, enabled, string to match
 ###
@@ -41,44 +48,35 @@ def step_1():
 
     functions.add_text(f"\n[Chall 4] uploading firmware to ram... please wait")
 
-    # Connect to the target board
-    session = ConnectHelper.session_with_chosen_probe()
-    session.open()
-
-    # Optionally halt the target
-    target = session.target
-    target.halt()
-
-    # Load binary file to specified address (e.g., 0x20000000)
-    newFirmware = "/tmp/f103-analysis/h3/rootshell/shellcode-0xRoM.bin"
-    programmer = FileProgrammer(session)
-    programmer.program(newFirmware, base_address=0x20000000, file_format='bin')
-
-    # Optionally resume execution
-    target.resume()
-    # Clean up
-    session.close()
-
-    with open(newFirmware, "rb") as f:
-        original_data = f.read()
-
-    # Connect to the target
-    session = ConnectHelper.session_with_chosen_probe()
-    session.open()
-
-    target = session.target
-    target.halt()
-
-    # Read back the memory from the target
-    read_data = target.read_memory_block8(0x20000000, len(original_data))
-
-    # Compare
-    if bytes(read_data) == original_data:
-         functions.add_text(f"[+] Shellcode loaded successfully.")
-    else:
-         functions.add_text(f"[!] Mismatch detected. Shellcode may not have loaded correctly.")
-
-    session.close()
+    # Connect to the target board; the context manager opens the session
+    # and guarantees the probe is released even if programming fails
+    session = ConnectHelper.session_with_chosen_probe(auto_open=False)
+    with session:
+        target = session.target
+        target.halt()
+
+        # Load binary file to specified address (e.g., 0x20000000)
+        newFirmware = "/tmp/f103-analysis/h3/rootshell/shellcode-0xRoM.bin"
+        programmer = FileProgrammer(session)
+        programmer.program(newFirmware, base_address=0x20000000, file_format='bin')
+
+        # Read back over the same session while still halted; word reads are
+        # 4x fewer SWD transactions than read_memory_block8
+        if VERIFY:
+            with open(newFirmware, "rb") as f:
+                original_data = f.read()
+
+            n_words = (len(original_data) + 3) // 4
+            words = target.read_memory_block32(0x20000000, n_words)
+            read_bytes = struct.pack(f"<{n_words}I", *words)[:len(original_data)]
+
+            if zlib.crc32(read_bytes) == zlib.crc32(original_data):
+                functions.add_text(f"[+] Shellcode loaded successfully.")
+            else:
+                functions.add_text(f"[!] Mismatch detected. Shellcode may not have loaded correctly.")
+
+        # Resume execution before the session closes
+        target.resume()
 
     functions.change_baudrate(9600)
     functions.add_text(f"[Chall 4] hold buttons 'boot0' and 'boot1' and press the 'glitch' button")
@@ -53,20 +53,16 @@ def random_glitch_params():
     NewRep = random.randint(1, 200)
     NewDel = random.randint(0, 500)
 
-    functions.set_config_value("length", NewLen)
-    functions.set_config_value("repeat", NewRep)
-    functions.set_config_value("delay", NewDel)
+    functions.set_config_values({"length": NewLen, "repeat": NewRep, "delay": NewDel})
 
     functions.add_text(f"🎲 Randomized: length={NewLen}, repeat={NewRep} (~{NewRep*8.3:.0f}ns), delay={NewDel}")
     functions.log_message(f"[DEMO] Random params: L={NewLen} R={NewRep} D={NewDel}")
 
 def cycle_triggers():
     """Cycle all trigger states through ^, v, - sequence"""
-    for i in range(8):
-        current_symbol = functions.get_trigger_string(i)
-        cycle = ["^", "v", "-"]
-        next_symbol = cycle[(cycle.index(current_symbol) + 1) % len(cycle)]
-        functions.set_trigger_string(i, next_symbol)
+    cycle = {"^": "v", "v": "-", "-": "^"}
+    current = functions.get_trigger_strings()
+    functions.set_trigger_strings([cycle[symbol] for symbol in current])
 
     functions.add_text("🔄 Cycled all triggers: ^ → v → - → ^")
     functions.log_message("[DEMO] Cycled trigger states")
@@ -1,6 +1,8 @@
 ######
 # LEAVE THESE IMPORTS!
 ######
+import os
+
 import functions
 import random
 from textual.widgets import Log
@@ -9,8 +11,9 @@ from textual.widgets import Log
 # config values (you can edit these to fit your environment and use case)
 ######
 
-# Serial port settings
-SERIAL_PORT = "/dev/ttyUSB0"
+# Serial port settings (falls back to the first USB serial adapter if
+# the hardcoded path is absent on this machine)
+SERIAL_PORT = functions.resolve_serial_port("/dev/ttyUSB0")
 BAUD_RATE = 115200
 UART_NEWLINE = "\n" # non-standard, default is \r\n
 
@@ -51,10 +54,16 @@ conditions = [
 # Custom functions for conditions to trigger
 ######
 
+# Widget resolved once; the CSS query walks the DOM and its result is
+# stable for the life of the app (config reloads reset this module)
+_scrollable_log = None
+
 def get_scroll_height():
+    global _scrollable_log
     if functions.app_instance:
-        text_widget = functions.app_instance.query_one(".scrollable_log", Log)  # Find the scrollable text area
-        height = text_widget.scrollable_content_region.height  # Get its height
+        if _scrollable_log is None:
+            _scrollable_log = functions.app_instance.query_one(".scrollable_log", Log)  # Find the scrollable text area
+        height = _scrollable_log.scrollable_content_region.height  # Get its height
                 # Ensure the text is a string and append it to the Log widget
         random_number = random.randint(1, 100)
         new_text = f"[CONDITION] Scrollable height: {height} and Random Number: {random_number}"
@@ -64,24 +73,17 @@ def get_scroll_height():
         functions.log_message("App instance not set!")  # Debugging in case it's called too early
 
 def toggle_all():
-	TriggersStatus = functions.get_trigger_value(0)
-	if TriggersStatus is True:
-		for i in range(8):
-			functions.set_trigger_value(i, False)
-		for i in range( len(conditions) ):
-			functions.set_condition_value(i, False)	
-	else:
-		for i in range(8):
-			functions.set_trigger_value(i, True)
-		for i in range( len(conditions) ):
-			functions.set_condition_value(i, True)	
+	# every switch gets the negation of trigger 0's state, computed once
+	mask = 0 if functions.get_trigger_value(0) else ~0
+	functions.set_all_trigger_values(mask)
+	functions.set_all_condition_values(mask)
+
+# symbol cycle for change_all_triggers, built once at import
+_NEXT_SYMBOL = {"^": "v", "v": "-", "-": "^"}
 
 def change_all_triggers():
-	for i in range(8):
-		current_symbol = functions.get_trigger_string(i)
-		cycle = ["^", "v", "-"]
-		next_symbol = cycle[(cycle.index(current_symbol) + 1) % len(cycle)]
-		functions.set_trigger_string(i, next_symbol)
+	current = functions.get_trigger_strings()
+	functions.set_trigger_strings([_NEXT_SYMBOL[symbol] for symbol in current])
 
 def random_values():
 	functions.glitching_switch(False)
@@ -90,13 +92,12 @@ def random_values():
 	OrigRep = functions.get_config_value("repeat")
 	OrigDel = functions.get_config_value("delay")
 
-	NewLen = random.randint(1, 100)
-	NewRep = random.randint(1, 100)
-	NewDel = random.randint(1, 100)
+	b = os.urandom(3)  # one C-level draw for all three parameters
+	NewLen = b[0] % 100 + 1
+	NewRep = b[1] % 100 + 1
+	NewDel = b[2] % 100 + 1
 
-	functions.set_config_value("length", NewLen)
-	functions.set_config_value("repeat", NewRep)
-	functions.set_config_value("delay", NewDel)
+	functions.set_config_values({"length": NewLen, "repeat": NewRep, "delay": NewDel})
 
 	functions.add_text(f"[UPDATED] length ({OrigLen} -> {NewLen}), repeat ({OrigRep} -> {NewRep}), delay ({OrigDel} -> {NewDel})")
 
@@ -9,7 +9,8 @@ from textual.widgets import Log
 # config values
 ######
 
-SERIAL_PORT = '/dev/ttyUSB0'
+# falls back to the first USB serial adapter if this path is absent
+SERIAL_PORT = functions.resolve_serial_port('/dev/ttyUSB0')
 BAUD_RATE = 115200
 
 LENGTH = 1
@@ -54,79 +55,42 @@ def start_chal_02():
     functions.run_output_high(0, 30000000) ## can also run_output_low() if need too
     #functions.execute_condition_action("glitched_too_far")
 
-increment_delay = True
-increment_length = True
-inc_delay_amount = 100
-inc_repeat_amount = 100
-inc_length_amount = 100  
+# Increment phases, advanced one per glitch: delay -> length -> repeat.
+# _amounts[i] is the step for phase i; glitched_too_far backs off the
+# phase that fired last and shrinks its step 100 -> 10 -> 1. A single
+# index replaces the old pair of booleans (whose global declaration
+# also misspelled inc_delay_amount).
+_PHASES = ("delay", "length", "repeat")
+_STEP_DOWN = {100: 10, 10: 1}
+_phase = 0
+_amounts = [100, 100, 100]
+
+# Shadow of the glitch parameters, seeded from the config values above.
+# The glitch loop reads and writes this dict directly instead of making
+# a widget round-trip per value; only the changed key is pushed to the
+# UI. Edits typed into the UI are picked up on config reload.
+_cfg = {"length": LENGTH, "repeat": REPEAT, "delay": DELAY}
 
 def perform_glitch():
-    global increment_delay, increment_length
-    global inc_delay_aamount, inc_repeat_amount, inc_length_amount
-    
-    
-    if increment_delay:
-        to_increment = "delay"
-        increment_amount = inc_delay_amount
-        increment_delay = False
-    else:
-        if increment_length:
-            to_increment = "length"
-            increment_amount = inc_length_amount
-            increment_length = False
-            increment_delay = True
-        else:
-            to_increment = "repeat"
-            increment_amount = inc_repeat_amount
-            increment_length = True
-            increment_delay = True
-    
-    current_val = functions.get_config_value(to_increment)
-    new_val = current_val + increment_amount
-    functions.set_config_value(to_increment, new_val)
-
-    functions.add_text(f"[auto] incrementing: {to_increment}")
-    
-    Len = functions.get_config_value("length")
-    Rep = functions.get_config_value("repeat")
-    Del = functions.get_config_value("delay")
-    functions.start_glitch(Len, Rep, Del)
-    
+    global _phase
+
+    key = _PHASES[_phase]
+    _cfg[key] += _amounts[_phase]
+    _phase = 0 if _phase == 2 else _phase + 1
+    functions.set_config_value(key, _cfg[key])
+
+    functions.add_text(f"[auto] incrementing: {key}")
+
+    functions.start_glitch(_cfg["length"], _cfg["repeat"], _cfg["delay"])
+
 def glitched_too_far():
-    global increment_delay, increment_length
-    global inc_delay_amount, inc_repeat_amount, inc_length_amount
-    
-    # Determine which value to decrement based on current state
-    if increment_delay:
-        if increment_length:
-            to_decrement = "repeat"
-            current_inc_amount = inc_repeat_amount
-        else:
-            to_decrement = "length"
-            current_inc_amount = inc_length_amount
-    else:
-        to_decrement = "delay"
-        current_inc_amount = inc_delay_amount
-    
-    # Get current value and decrement it
-    current_val = functions.get_config_value(to_decrement)
-    new_val = current_val - current_inc_amount 
-    functions.set_config_value(to_decrement, new_val)
-    
-    # Update the increment amount for next time
-    if current_inc_amount == 100:
-        new_inc_amount = 10
-    elif current_inc_amount == 10:
-        new_inc_amount = 1
-    else:
-        new_inc_amount = current_inc_amount  # keep as is if not 100 or 10
-    
-    # Update the correct increment amount variable
-    if to_decrement == "delay":
-        inc_delay_amount = new_inc_amount
-    elif to_decrement == "length":
-        inc_length_amount = new_inc_amount
-    elif to_decrement == "repeat":
-        inc_repeat_amount = new_inc_amount
-
-    functions.add_text(f"[auto] decrementing: {to_decrement}")
\ No newline at end of file
+    # Back off the phase that was incremented last
+    prev = (_phase - 1) % 3
+    key = _PHASES[prev]
+    _cfg[key] -= _amounts[prev]
+    functions.set_config_value(key, _cfg[key])
+
+    # Shrink that phase's step for the next pass
+    _amounts[prev] = _STEP_DOWN.get(_amounts[prev], _amounts[prev])
+
+    functions.add_text(f"[auto] decrementing: {key}")
\ No newline at end of file
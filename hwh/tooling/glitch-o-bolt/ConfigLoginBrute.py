@@ -1,6 +1,9 @@
 ######
 # LEAVE THESE IMPORTS!
 ######
+import array
+import mmap
+
 import functions
 import random
 from textual.widgets import Log
@@ -9,8 +12,9 @@ from textual.widgets import Log
 # config values (you can edit these to fit your environment and use case)
 ######
 
-# Serial port settings
-SERIAL_PORT = "/dev/ttyACM3"
+# Serial port settings (falls back to the first USB serial adapter if
+# the hardcoded path is absent on this machine)
+SERIAL_PORT = functions.resolve_serial_port("/dev/ttyACM3")
 BAUD_RATE = 115200
 
 LENGTH = 10
@@ -49,25 +53,57 @@ def send_username():
     functions.send_uart_message("root")  
     functions.add_text("[auto] $> root")    
 
-# uncomment the following to use a password list!
-#with open("passwords.txt", "r") as f:
-#    password_list = [line.strip() for line in f if line.strip()]
+def load_password_file(path):
+    """Map a wordlist read-only and index it by line offsets.
+
+    The file is mmap'd and scanned once for newline positions; each
+    password is then a zero-copy memoryview slice of the mapping. Even a
+    rockyou-sized list costs one mapping plus an offset array instead of
+    millions of Python str objects.
+    """
+    f = open(path, "rb")  # kept open for the lifetime of the mapping
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    offsets = array.array("Q", [0])
+    pos = mm.find(b"\n")
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = mm.find(b"\n", pos + 1)
+    if offsets[-1] < len(mm):
+        offsets.append(len(mm) + 1)  # virtual newline after the last line
+
+    view = memoryview(mm)
+    passwords = []
+    for i in range(len(offsets) - 1):
+        start, end = offsets[i], offsets[i + 1] - 1
+        if end > start and mm[end - 1] == 0x0D:  # trailing \r
+            end -= 1
+        if end > start:  # skip blank lines
+            passwords.append(view[start:end])
+    return tuple(passwords)
 
 password_list = ["root", "password", "123456", "qwerty", "admin", "letmein"]
+
+# Encoded once at import so each attempt sends pre-built bytes instead
+# of re-encoding the string on every glitch iteration
+password_bytes = tuple(p.encode("ascii") for p in password_list)
+
+# uncomment the following to use a password list!
+#password_bytes = load_password_file("passwords.txt")
+
 current_password_index = 0
 
 def send_password():
-    global password_list, current_password_index
-    
-    passCount = len(password_list)
-    # Get the current password
-    password = password_list[current_password_index]
-    
-    # Send the password and update UI
-    functions.send_uart_message(password)  
-    functions.add_text(f"[pass {current_password_index} / {passCount}] $> {password}")
+    global current_password_index
+
+    passCount = len(password_bytes)
+    password = password_bytes[current_password_index]
+
+    # Send the pre-encoded password and update UI
+    functions.send_uart_message(password)
+    functions.add_text(f"[pass {current_password_index} / {passCount}] $> {bytes(password).decode('ascii', 'replace')}")
     # Move to the next password (wrap around if at end of list)
-    current_password_index = (current_password_index + 1) % len(password_list)
+    current_password_index = 0 if current_password_index + 1 == passCount else current_password_index + 1
 
 def send_return():
     functions.send_uart_message(" ")    
\ No newline at end of file
@@ -75,6 +75,8 @@ class LayoutApp(App):
         asyncio.create_task(self.connect_serial())
         asyncio.create_task(functions.monitor_buffer(self))
         asyncio.create_task(functions.glitch(self))
+        # Paint queued add_text output once per tick instead of per call
+        self.set_interval(0.05, functions.flush_text)
         functions.log_message("[DEBUG] Serial tasks created")
 
     async def connect_serial(self):
@@ -73,9 +73,8 @@ class CTFDevice:
         print("\n[*] Disconnected")
 
 
-def interactive_mode():
-    """Interactive mode for CTF device"""
-    print("""
+# Static banners built once at import; emitted with a single write each
+INTERACTIVE_BANNER = """
 ╔══════════════════════════════════════════════════════════════════════╗
 ║                                                                      ║
 ║  CTF Device Interactive Mode                                        ║
@@ -88,7 +87,21 @@ def interactive_mode():
 ║    Ctrl+C to exit                                                    ║
 ║                                                                      ║
 ╚══════════════════════════════════════════════════════════════════════╝
-""")
+"""
+
+PROBE_BANNER = """
+╔══════════════════════════════════════════════════════════════════════╗
+║                                                                      ║
+║  CTF Device Auto-Probe                                              ║
+║  Trying common commands to explore the device                       ║
+║                                                                      ║
+╚══════════════════════════════════════════════════════════════════════╝
+"""
+
+
+def interactive_mode():
+    """Interactive mode for CTF device"""
+    sys.stdout.write(INTERACTIVE_BANNER + "\n")
 
     device = CTFDevice()
 
@@ -119,14 +132,7 @@ def interactive_mode():
 
 def auto_probe():
     """Automatically probe the device with common commands"""
-    print("""
-╔══════════════════════════════════════════════════════════════════════╗
-║                                                                      ║
-║  CTF Device Auto-Probe                                              ║
-║  Trying common commands to explore the device                       ║
-║                                                                      ║
-╚══════════════════════════════════════════════════════════════════════╝
-""")
+    sys.stdout.write(PROBE_BANNER + "\n")
 
     device = CTFDevice()
 
@@ -111,12 +111,11 @@ def test_power_cycling(bp, monitor):
         print(f"    Current: {info['psu_measured_ma']}mA")
 
 
-def glitching_attack_menu(bp, monitor):
-    """Interactive glitching menu"""
-    print("\n" + "="*70)
-    print("GLITCHING ATTACK MENU")
-    print("="*70)
-    print("""
+# Menu body is static; build it once instead of per-print formatting
+ATTACK_MENU = "\n" + "=" * 70 + """
+GLITCHING ATTACK MENU
+""" + "=" * 70 + """
+
 Available attacks:
   [1] Power cycle (5 times)
   [2] Rapid power glitch
@@ -124,7 +123,12 @@ Available attacks:
   [4] Monitor only (watch for button presses)
   [5] Curious Bolt glitch (when backend ready)
   [q] Quit
-""")
+"""
+
+
+def glitching_attack_menu(bp, monitor):
+    """Interactive glitching menu"""
+    sys.stdout.write(ATTACK_MENU)
 
     while True:
         choice = input("\nSelect attack: ").strip()
@@ -165,9 +169,7 @@ Available attacks:
             print("Invalid choice")
 
 
-def main():
-    """Main glitching setup"""
-    print("""
+BANNER = """
 ╔══════════════════════════════════════════════════════════════════════╗
 ║                                                                      ║
 ║  Bolt CTF Glitching Attack Setup                                    ║
@@ -176,7 +178,12 @@ def main():
 ║  while monitoring serial output for successful exploits.            ║
 ║                                                                      ║
 ╚══════════════════════════════════════════════════════════════════════╝
-""")
+"""
+
+
+def main():
+    """Main glitching setup"""
+    sys.stdout.write(BANNER + "\n")
 
     # Setup serial monitor
     print("[*] Starting serial monitor on Bolt CTF output...")